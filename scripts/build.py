@@ -7,6 +7,7 @@ for the YouTube Downloader application.
 
 import os
 import platform
+import shutil
 import subprocess
 import sys
 
@@ -16,22 +17,53 @@ def get_project_root() -> str:
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
-def build_executable():
-    """Build the executable using PyInstaller."""
+# Build variants: extra PyInstaller flags per variant. The default
+# "windowed" build is the shipped app; "console" keeps stdout attached
+# for debugging.
+VARIANTS = {
+    "windowed": ["--windowed"],
+    "console": [],
+}
+
+
+def build_executable(variants=("windowed",)):
+    """
+    Build one or more executable variants using PyInstaller.
+
+    Variants run concurrently, each with its own PYINSTALLER_CONFIG_DIR
+    so parallel builds don't corrupt each other's caches.
+
+    Returns the path of the first successfully built executable, or None.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+        results = list(executor.map(_build_variant, variants))
+
+    for exe_path in results:
+        if exe_path:
+            return exe_path
+    return None
+
+
+def _build_variant(variant: str):
+    """Build a single executable variant using PyInstaller."""
     project_root = get_project_root()
     src_dir = os.path.join(project_root, "src")
     main_script = os.path.join(src_dir, "main.py")
     dist_dir = os.path.join(project_root, "dist")
-    
+
     # Determine the executable name based on OS
     system = platform.system()
     exe_name = "YTDownloader" if system == "Windows" else "yt-downloader"
-    
+    if variant != "windowed":
+        exe_name = f"{exe_name}-{variant}"
+
     # PyInstaller command
     cmd = [
         sys.executable, "-m", "PyInstaller",
         "--onefile",
-        "--windowed",
+        *VARIANTS[variant],
         f"--name={exe_name}",
         f"--distpath={dist_dir}",
         "--clean",
@@ -40,8 +72,16 @@ def build_executable():
         "--hidden-import=yt_dlp",
         "--hidden-import=yt_dlp.extractor",
         "--hidden-import=yt_dlp.postprocessor",
-        # Collect all yt-dlp data
-        "--collect-all=yt_dlp",
+        # Collect only yt-dlp's data files; --collect-all also dragged in
+        # test fixtures and inflated the onefile payload
+        "--collect-data=yt_dlp",
+        # Keep stdlib packages the app never imports out of the bundle -
+        # a smaller payload means a faster onefile unpack at launch
+        "--exclude-module=test",
+        "--exclude-module=unittest",
+        "--exclude-module=pydoc_data",
+        "--exclude-module=xmlrpc",
+        "--exclude-module=tkinter.test",
         main_script
     ]
     
@@ -49,12 +89,32 @@ def build_executable():
     icon_path = os.path.join(src_dir, "assets", "icon.ico")
     if system == "Windows" and os.path.exists(icon_path):
         cmd.insert(-1, f"--icon={icon_path}")
+
+    # Compress the bundle with UPX when available - fewer bytes for the
+    # onefile stub to read and unpack at every launch
+    upx_path = shutil.which("upx")
+    if upx_path:
+        cmd.insert(-1, f"--upx-dir={os.path.dirname(upx_path)}")
+        if system == "Windows":
+            # Compressing the VC runtime breaks the PyInstaller bootloader
+            cmd.insert(-1, "--upx-exclude=vcruntime140.dll")
+
+    # Drop symbol tables from the Linux binary
+    if system == "Linux":
+        cmd.insert(-1, "--strip")
     
     print(f"Building {exe_name} for {system}...")
     print(f"Command: {' '.join(cmd)}")
-    
+
+    # Isolate the PyInstaller cache per variant+process so concurrent
+    # builds (CI matrix, console+windowed) never share state
+    env = os.environ.copy()
+    env["PYINSTALLER_CONFIG_DIR"] = os.path.join(
+        dist_dir, ".pyinstaller", f"{os.getpid()}-{variant}"
+    )
+
     try:
-        subprocess.run(cmd, check=True, cwd=project_root)
+        subprocess.run(cmd, check=True, cwd=project_root, env=env)
         
         # Success message
         exe_ext = ".exe" if system == "Windows" else ""
@@ -86,7 +146,24 @@ def create_windows_shortcut(exe_path: str):
         winreg.CloseKey(key)
         
         shortcut_path = os.path.join(desktop_path, "YouTube Downloader.lnk")
-        
+
+        # Prefer a direct COM call (pywin32): same WScript.Shell object
+        # without paying for a PowerShell process startup
+        try:
+            import win32com.client
+
+            shell = win32com.client.Dispatch("WScript.Shell")
+            shortcut = shell.CreateShortcut(shortcut_path)
+            shortcut.TargetPath = exe_path
+            shortcut.WorkingDirectory = os.path.dirname(exe_path)
+            shortcut.Description = "YouTube Downloader"
+            shortcut.Save()
+
+            print(f"🔗 Shortcut created: {shortcut_path}")
+            return
+        except ImportError:
+            pass  # pywin32 not installed - fall back to PowerShell
+
         # Create shortcut using PowerShell
         ps_script = f'''
         $WScriptShell = New-Object -ComObject WScript.Shell
@@ -115,8 +192,12 @@ def main():
     print("YouTube Downloader - Build Script")
     print("=" * 50)
     
-    exe_path = build_executable()
-    
+    # Extra variants can be requested on the command line,
+    # e.g. "python scripts/build.py windowed console"
+    variants = tuple(arg for arg in sys.argv[1:] if arg in VARIANTS) or ("windowed",)
+
+    exe_path = build_executable(variants)
+
     if exe_path and platform.system() == "Windows":
         print("\nCreating Windows shortcut...")
         create_windows_shortcut(exe_path)
@@ -10,12 +10,37 @@ import platform
 import shutil
 import subprocess
 import sys
+import time
+import urllib.error
 import urllib.request
 import zipfile
-import tempfile
+from functools import lru_cache
 from typing import Optional, Callable
 
+# platform.system() parses uname/registry each call; resolve it once
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == 'Windows'
 
+# Fallback install locations, frozen at import: the env-derived pieces
+# don't change at runtime, so there is no point rebuilding them per call
+if _IS_WINDOWS:
+    _COMMON_FFMPEG_PATHS = (
+        os.path.join(os.environ.get('ProgramFiles', 'C:\\Program Files'), 'ffmpeg', 'bin', 'ffmpeg.exe'),
+        os.path.join(os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)'), 'ffmpeg', 'bin', 'ffmpeg.exe'),
+        'C:\\ffmpeg\\bin\\ffmpeg.exe',
+        os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Programs', 'ffmpeg', 'bin', 'ffmpeg.exe'),
+        os.path.join(os.environ.get('USERPROFILE', ''), 'scoop', 'apps', 'ffmpeg', 'current', 'bin', 'ffmpeg.exe'),
+    )
+else:
+    _COMMON_FFMPEG_PATHS = (
+        '/usr/bin/ffmpeg',
+        '/usr/local/bin/ffmpeg',
+        '/snap/bin/ffmpeg',
+        '/opt/homebrew/bin/ffmpeg',
+    )
+
+
+@lru_cache(maxsize=1)
 def get_app_bin_dir() -> str:
     """Get the bin directory inside the app folder."""
     # Check if running as a PyInstaller bundle
@@ -32,16 +57,21 @@ def get_app_bin_dir() -> str:
     return bin_dir
 
 
+@lru_cache(maxsize=1)
 def find_ffmpeg() -> Optional[str]:
-    """Find FFmpeg executable. Returns path if found, None otherwise."""
+    """Find FFmpeg executable. Returns path if found, None otherwise.
+
+    The result is cached: the lookup costs several stat calls plus a
+    PATH scan and is hit repeatedly from UI code. The cache is cleared
+    after a successful download installs a new binary.
+    """
     # Check in app's bin directory first
     bin_dir = get_app_bin_dir()
     
-    is_windows = platform.system() == 'Windows'
-    exe_name = 'ffmpeg.exe' if is_windows else 'ffmpeg'
+    exe_name = 'ffmpeg.exe' if _IS_WINDOWS else 'ffmpeg'
     
     local_ffmpeg = os.path.join(bin_dir, exe_name)
-    if os.path.exists(local_ffmpeg):
+    if os.path.isfile(local_ffmpeg):
         return local_ffmpeg
     
     # Check system PATH
@@ -51,24 +81,8 @@ def find_ffmpeg() -> Optional[str]:
     
     # Fallback: check common installation paths
     # (shutil.which may fail in frozen GUI apps with different PATH)
-    if is_windows:
-        common_paths = [
-            os.path.join(os.environ.get('ProgramFiles', 'C:\\Program Files'), 'ffmpeg', 'bin', 'ffmpeg.exe'),
-            os.path.join(os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)'), 'ffmpeg', 'bin', 'ffmpeg.exe'),
-            'C:\\ffmpeg\\bin\\ffmpeg.exe',
-            os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Programs', 'ffmpeg', 'bin', 'ffmpeg.exe'),
-            os.path.join(os.environ.get('USERPROFILE', ''), 'scoop', 'apps', 'ffmpeg', 'current', 'bin', 'ffmpeg.exe'),
-        ]
-    else:
-        common_paths = [
-            '/usr/bin/ffmpeg',
-            '/usr/local/bin/ffmpeg',
-            '/snap/bin/ffmpeg',
-            '/opt/homebrew/bin/ffmpeg',
-        ]
-    
-    for path in common_paths:
-        if path and os.path.exists(path):
+    for path in _COMMON_FFMPEG_PATHS:
+        if path and os.path.isfile(path):
             return path
     
     return None
@@ -79,7 +93,20 @@ def is_ffmpeg_installed() -> bool:
     ffmpeg_path = find_ffmpeg()
     if not ffmpeg_path:
         return False
-    
+
+    # Binaries we installed ourselves don't need the ~30 ms
+    # "ffmpeg -version" probe on every launch - a sanity check on the
+    # file itself is enough
+    if ffmpeg_path.startswith(get_app_bin_dir()):
+        try:
+            if _IS_WINDOWS:
+                # Valid PE executables start with the 'MZ' magic
+                with open(ffmpeg_path, 'rb') as f:
+                    return f.read(2) == b'MZ'
+            return os.access(ffmpeg_path, os.X_OK)
+        except OSError:
+            return False
+
     try:
         # GUI-safe subprocess call (for windowed apps without console)
         kwargs = {
@@ -89,7 +116,7 @@ def is_ffmpeg_installed() -> bool:
         }
         
         # On Windows, prevent console window from appearing
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
             kwargs['creationflags'] = CREATE_NO_WINDOW
         
@@ -112,24 +139,223 @@ def download_ffmpeg(progress_callback: Optional[Callable[[str, float], None]] =
     if progress_callback:
         progress_callback("Verificando FFmpeg...", 0)
     
-    system = platform.system()
     bin_dir = get_app_bin_dir()
     
     try:
-        if system == 'Windows':
-            return _download_ffmpeg_windows(bin_dir, progress_callback)
-        elif system == 'Linux':
-            return _download_ffmpeg_linux(bin_dir, progress_callback)
-        elif system == 'Darwin':
-            return _download_ffmpeg_macos(bin_dir, progress_callback)
+        if _IS_WINDOWS:
+            success = _download_ffmpeg_windows(bin_dir, progress_callback)
+        elif _SYSTEM == 'Linux':
+            success = _download_ffmpeg_linux(bin_dir, progress_callback)
+        elif _SYSTEM == 'Darwin':
+            success = _download_ffmpeg_macos(bin_dir, progress_callback)
         else:
-            return False
+            success = False
+
+        if success:
+            # A new binary exists now - drop the cached lookup result
+            find_ffmpeg.cache_clear()
+
+        return success
     except Exception as e:
         if progress_callback:
             progress_callback(f"Erro: {str(e)}", 0)
         return False
 
 
+def _stream_download(url: str, dest_path: str, callback: Optional[Callable] = None,
+                     etag_path: Optional[str] = None) -> int:
+    """
+    Download a URL to a file using a large streaming buffer.
+
+    Reads the response in 1 MiB chunks instead of urlretrieve's small
+    default block size, so the transfer does fewer, larger writes.
+    Progress callbacks are only issued when the percentage advances by
+    at least 1 point to avoid flooding the GUI.
+
+    If etag_path is given, the response ETag is persisted there and a
+    conditional request is made on the next call, so an unchanged
+    upstream file is not re-downloaded. A leftover partial file at
+    dest_path is resumed with an HTTP Range request (validated by
+    If-Range against the saved ETag) instead of restarting from zero.
+
+    Uses httpx with HTTP/2 when installed (connection reuse through the
+    GitHub -> CDN redirect cuts time-to-first-byte); otherwise falls
+    back to urllib.
+
+    Returns the HTTP status code (200, 206 for a resumed download,
+    or 304 when the cached copy is still current).
+    """
+    try:
+        import httpx
+    except ImportError:
+        return _stream_download_urllib(url, dest_path, callback, etag_path)
+    return _stream_download_httpx(httpx, url, dest_path, callback, etag_path)
+
+
+def _conditional_headers(dest_path: str, etag_path: Optional[str]) -> tuple:
+    """Build Range/If-Range/If-None-Match headers for a conditional GET."""
+    headers = {}
+    saved_etag = None
+    if etag_path and os.path.isfile(etag_path):
+        try:
+            with open(etag_path, 'r', encoding='utf-8') as f:
+                saved_etag = f.read().strip() or None
+        except OSError:
+            pass
+
+    existing = os.path.getsize(dest_path) if os.path.isfile(dest_path) else 0
+    if existing > 0 and saved_etag is None:
+        # The asset is a mutable "latest" build. With no validator to
+        # pin the partial to a specific build, a Range resume could
+        # append bytes from different content and corrupt the zip, so
+        # throw the partial away and start over.
+        try:
+            os.remove(dest_path)
+        except OSError:
+            pass
+        existing = 0
+
+    if existing > 0:
+        headers['Range'] = f'bytes={existing}-'
+        # If-Range downgrades the resume to a full 200 response when
+        # the asset changed since the partial was written
+        headers['If-Range'] = saved_etag
+    elif saved_etag:
+        headers['If-None-Match'] = saved_etag
+    return headers, existing
+
+
+def _save_etag(etag_path: Optional[str], etag: Optional[str]) -> None:
+    """Persist the response ETag for the next conditional request."""
+    if etag_path and etag:
+        try:
+            with open(etag_path, 'w', encoding='utf-8') as f:
+                f.write(etag)
+        except OSError:
+            pass
+
+
+def _write_body(chunks, dest_path: str, callback: Optional[Callable],
+                resumed: bool, existing: int, total_size: int) -> None:
+    """Write response chunks to dest_path with throttled progress updates."""
+    downloaded = existing if resumed else 0
+    last_percent = -1
+    last_time = 0.0
+
+    # 1 MiB write buffer coalesces the chunked reads into few
+    # large write() syscalls
+    with open(dest_path, 'ab' if resumed else 'wb', buffering=1 << 20) as f:
+        for buf in chunks:
+            f.write(buf)
+            downloaded += len(buf)
+
+            if callback and total_size > 0:
+                # At most ~10 updates/sec, and only when the whole
+                # percent actually moved
+                now = time.monotonic()
+                percent = min(10 + (downloaded / total_size) * 70, 80)
+                if percent - last_percent >= 1 and now - last_time > 0.1:
+                    last_percent = percent
+                    last_time = now
+                    callback(f"Baixando FFmpeg... {percent:.0f}%", percent)
+
+
+def _stream_download_urllib(url: str, dest_path: str, callback: Optional[Callable],
+                            etag_path: Optional[str]) -> int:
+    """urllib implementation of _stream_download."""
+    chunk_size = 1 << 20  # 1 MiB
+    headers, existing = _conditional_headers(dest_path, etag_path)
+
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        resp = urllib.request.urlopen(req)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304
+        if e.code == 416 and existing > 0:
+            # Partial file no longer matches upstream - start over
+            os.remove(dest_path)
+            return _stream_download_urllib(url, dest_path, callback, etag_path)
+        raise
+
+    with resp:
+        # 206 means the server honoured the Range header; append to the
+        # partial file, otherwise truncate and start fresh
+        resumed = resp.status == 206
+        start = existing if resumed else 0
+        total_size = int(resp.headers.get('Content-Length') or 0) + start
+
+        chunks = iter(lambda: resp.read(chunk_size), b'')
+        _write_body(chunks, dest_path, callback, resumed, existing, total_size)
+
+        _save_etag(etag_path, resp.headers.get('ETag'))
+        return resp.status
+
+
+def _stream_download_httpx(httpx, url: str, dest_path: str, callback: Optional[Callable],
+                           etag_path: Optional[str]) -> int:
+    """httpx implementation of _stream_download with HTTP/2 when possible."""
+    headers, existing = _conditional_headers(dest_path, etag_path)
+
+    try:
+        client = httpx.Client(http2=True, follow_redirects=True, timeout=30)
+    except ImportError:
+        # The h2 extra is not installed - plain HTTP/1.1 still benefits
+        # from httpx's connection reuse across the redirect chain
+        client = httpx.Client(follow_redirects=True, timeout=30)
+
+    with client:
+        with client.stream('GET', url, headers=headers) as resp:
+            if resp.status_code == 304:
+                return 304
+            if resp.status_code == 416 and existing > 0:
+                os.remove(dest_path)
+                return _stream_download_httpx(httpx, url, dest_path, callback, etag_path)
+            resp.raise_for_status()
+
+            resumed = resp.status_code == 206
+            start = existing if resumed else 0
+            total_size = int(resp.headers.get('Content-Length') or 0) + start
+
+            _write_body(resp.iter_bytes(1 << 20), dest_path, callback,
+                        resumed, existing, total_size)
+
+            _save_etag(etag_path, resp.headers.get('ETag'))
+            return resp.status_code
+
+
+def _extract_zip_members(zip_path: str, dest_dir: str, names: tuple) -> set:
+    """
+    Stream-copy only the named members of a zip archive into dest_dir.
+
+    Skips decompressing the rest of the archive (docs, presets,
+    licenses) entirely. Returns the set of member names found.
+    """
+    extracted = set()
+
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for member in zip_ref.infolist():
+            name = os.path.basename(member.filename)
+            if name not in names:
+                continue
+
+            # Write to a sibling .part and rename: os.replace is atomic
+            # on the same filesystem, so a crashed extraction never
+            # leaves a truncated binary at the final path
+            dst_path = os.path.join(dest_dir, name)
+            tmp_path = dst_path + '.part'
+            with zip_ref.open(member) as src, open(tmp_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+
+            if os.name == 'posix':
+                os.chmod(tmp_path, 0o755)
+
+            os.replace(tmp_path, dst_path)
+            extracted.add(name)
+
+    return extracted
+
+
 def _download_ffmpeg_windows(bin_dir: str, callback: Optional[Callable] = None) -> bool:
     """Download FFmpeg for Windows."""
     # Use a pre-built FFmpeg release from GitHub
@@ -137,45 +363,47 @@ def _download_ffmpeg_windows(bin_dir: str, callback: Optional[Callable] = None)
     
     if callback:
         callback("Baixando FFmpeg...", 10)
-    
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        zip_path = os.path.join(tmp_dir, 'ffmpeg.zip')
-        
-        # Download with progress
-        def _report_progress(block_num, block_size, total_size):
-            if callback and total_size > 0:
-                percent = min(10 + (block_num * block_size / total_size) * 70, 80)
-                callback(f"Baixando FFmpeg... {percent:.0f}%", percent)
-        
-        urllib.request.urlretrieve(url, zip_path, _report_progress)
-        
+
+    # The partial zip and ETag live next to the binaries so an
+    # interrupted download resumes instead of restarting from zero
+    zip_path = os.path.join(bin_dir, '.ffmpeg.zip.part')
+    etag_path = os.path.join(bin_dir, '.ffmpeg.etag')
+
+    # A saved ETag is only useful while the installed binary exists.
+    # If ffmpeg.exe is gone (AV quarantine, manual deletion) a
+    # conditional GET answers 304 with nothing to extract, and every
+    # retry repeats it - so drop the ETag and fetch unconditionally.
+    if not os.path.isfile(os.path.join(bin_dir, 'ffmpeg.exe')):
+        try:
+            os.remove(etag_path)
+        except OSError:
+            pass
+
+    status = _stream_download(url, zip_path, callback, etag_path=etag_path)
+
+    if status == 304 and os.path.isfile(os.path.join(bin_dir, 'ffmpeg.exe')):
+        # Upstream unchanged and binaries already installed
         if callback:
-            callback("Extraindo FFmpeg...", 85)
-        
-        # Extract
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(tmp_dir)
-        
+            callback("FFmpeg instalado!", 100)
+        return True
+
+    if callback:
+        callback("Extraindo FFmpeg...", 85)
+
+    # Extract only the two binaries straight from the archive instead
+    # of unpacking docs/presets/licenses and walking the result
+    extracted = _extract_zip_members(zip_path, bin_dir, ('ffmpeg.exe', 'ffprobe.exe'))
+
+    try:
+        os.remove(zip_path)
+    except OSError:
+        pass
+
+    if 'ffmpeg.exe' in extracted:
         if callback:
-            callback("Instalando FFmpeg...", 95)
-        
-        # Find and copy ffmpeg.exe
-        for root, dirs, files in os.walk(tmp_dir):
-            for file in files:
-                if file == 'ffmpeg.exe':
-                    src = os.path.join(root, file)
-                    dst = os.path.join(bin_dir, 'ffmpeg.exe')
-                    shutil.copy2(src, dst)
-                    
-                    # Also copy ffprobe if available
-                    ffprobe_src = os.path.join(root, 'ffprobe.exe')
-                    if os.path.exists(ffprobe_src):
-                        shutil.copy2(ffprobe_src, os.path.join(bin_dir, 'ffprobe.exe'))
-                    
-                    if callback:
-                        callback("FFmpeg instalado!", 100)
-                    return True
-    
+            callback("FFmpeg instalado!", 100)
+        return True
+
     return False
 
 
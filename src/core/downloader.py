@@ -5,22 +5,50 @@ This module provides the core functionality for downloading videos from YouTube
 using yt-dlp library, following the Single Responsibility Principle.
 """
 
+import functools
 import os
 import re
+import threading
+import time
 from typing import Callable, Optional
 
-import yt_dlp
-
 from .file_utils import sanitize_filename
+from .info_cache import InfoCache, extract_video_id
 from ..models import DownloadProgress, DownloadResult, VideoFormat
 
 
+# Compiled once: strip_ansi_codes runs on every progress tick
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# yt-dlp leftovers: partial downloads and unmerged per-format fragments
+_TEMP_FILE_RE = re.compile(r'\.(part|ytdl|temp)$|\.f\d+\.(mp4|webm|m4a)$')
+
+
 def strip_ansi_codes(text: Optional[str]) -> Optional[str]:
     """Remove ANSI escape codes from a string."""
     if text is None:
         return None
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    return _ANSI_RE.sub('', text)
+
+
+def _safe_unlink(path: str) -> None:
+    """Delete a file, ignoring it already being gone or locked."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@functools.cache
+def _ydl():
+    """Import yt_dlp on first use.
+
+    Pulling in yt-dlp loads hundreds of extractor modules and costs a
+    few hundred milliseconds, so it is deferred until the first actual
+    network operation instead of slowing down app startup.
+    """
+    import yt_dlp
+    return yt_dlp
 
 
 ProgressCallback = Callable[[DownloadProgress], None]
@@ -34,7 +62,11 @@ class YouTubeDownloader:
     Handles all interaction with yt-dlp library and provides a clean interface
     for downloading videos with progress tracking.
     """
-    
+
+    # How long a fetched info dict stays valid (seconds). Stream URLs
+    # expire server-side after a few hours, so keep this conservative.
+    _INFO_CACHE_TTL = 600
+
     def __init__(self, output_dir: str, progress_callback: Optional[ProgressCallback] = None,
                  video_complete_callback: Optional[VideoCompleteCallback] = None):
         """
@@ -51,8 +83,13 @@ class YouTubeDownloader:
         self._current_title: Optional[str] = None
         self._current_url: Optional[str] = None
         self._noplaylist = True  # Default: download single video only
-        self._cancelled = False
+        self._cancel_event = threading.Event()
         self._temp_files: list[str] = []  # Track temp files for cleanup
+        self._outdir_created = False
+        self._info_cache: dict[str, tuple[float, dict]] = {}
+        self._disk_cache = InfoCache()
+        self._last_progress_time = 0.0
+        self._last_progress_pct = -1
     
     @property
     def output_dir(self) -> str:
@@ -63,26 +100,75 @@ class YouTubeDownloader:
     def output_dir(self, value: str) -> None:
         """Set the output directory."""
         self._output_dir = value
+        self._outdir_created = False
     
-    def get_video_info(self, url: str) -> Optional[dict]:
+    @staticmethod
+    def _cache_key(url: str) -> str:
+        """Cache key for a URL: the video id when one can be parsed.
+
+        Keying by id lets youtu.be short links, shorts URLs and full
+        watch URLs for the same video share one cache entry.
+        """
+        return extract_video_id(url) or url
+
+    def _get_cached_info(self, url: str) -> Optional[dict]:
+        """Return a cached, fully processed info dict for url, or None."""
+        entry = self._info_cache.get(self._cache_key(url))
+        if entry and time.monotonic() - entry[0] < self._INFO_CACHE_TTL:
+            return entry[1]
+        return None
+
+    def _cache_info(self, url: str, info: dict) -> None:
+        """Store a processed info dict so later calls skip the network."""
+        self._info_cache[self._cache_key(url)] = (time.monotonic(), info)
+
+    def clear_info_cache(self) -> None:
+        """Drop both the in-memory and on-disk metadata caches."""
+        self._info_cache.clear()
+        self._disk_cache.clear()
+
+    def get_video_info(self, url: str, allow_cache: bool = True) -> Optional[dict]:
         """
         Get video information without downloading.
         
         Args:
             url: The YouTube video URL.
+            allow_cache: If True, serve from the in-memory/disk caches.
             
         Returns:
             Dictionary with video info (title, etc.) or None if failed.
         """
+        cached = self._get_cached_info(url) if allow_cache else None
+        if cached is None and allow_cache:
+            cached = self._disk_cache.get(url)
+        if cached is not None:
+            return {
+                'title': cached.get('title', 'video'),
+                'duration': cached.get('duration', 0),
+                'uploader': cached.get('uploader', ''),
+            }
+
         try:
+            yt_dlp = _ydl()
             ydl_opts = {
                 'quiet': True,
                 'no_warnings': True,
                 'extract_flat': False,
                 'noplaylist': True,  # Get info for single video only
+                # Fail fast on dead networks instead of hanging the
+                # "checking video" phase for minutes
+                'socket_timeout': 5,
+                # Only metadata is needed here - skip the player configs
+                # used for format/signature resolution
+                'extractor_args': {'youtube': {'player_skip': ['configs']}},
             }
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+                # process=False skips format enumeration and signature
+                # decryption; only title/duration/uploader are used
+                info = ydl.extract_info(url, download=False, process=False)
+                if not info or 'title' not in info:
+                    # Some extractors only fill metadata during processing
+                    info = ydl.extract_info(url, download=False)
                 return {
                     'title': info.get('title', 'video'),
                     'duration': info.get('duration', 0),
@@ -91,6 +177,36 @@ class YouTubeDownloader:
         except Exception:
             return None
     
+    def get_video_info_batch(self, urls: list[str], max_workers: int = 8) -> list[Optional[dict]]:
+        """
+        Fetch video info for several URLs concurrently.
+
+        Metadata extraction is network-bound, so overlapping requests in
+        a thread pool gives a near-linear speedup over fetching a
+        playlist's entries one by one. Cached URLs resolve instantly.
+
+        Args:
+            urls: The YouTube video URLs.
+            max_workers: Maximum concurrent fetches.
+
+        Returns:
+            Info dicts in input order; None for failed or timed-out URLs.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+            futures = [pool.submit(self.get_video_info, url) for url in urls]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result(timeout=30))
+                except Exception:
+                    results.append(None)
+            return results
+
     def check_file_exists(self, title: str) -> Optional[str]:
         """
         Check if a file with the given title already exists.
@@ -102,57 +218,63 @@ class YouTubeDownloader:
             File path if exists, None otherwise.
         """
         expected_path = os.path.join(self._output_dir, f"{title}.mp4")
-        if os.path.exists(expected_path):
+        try:
+            os.stat(expected_path)
             return expected_path
-        return None
+        except OSError:
+            return None
     
+    @property
+    def cancelled(self) -> bool:
+        """Whether the current download has been cancelled."""
+        return self._cancel_event.is_set()
+
     def cancel(self) -> None:
         """Cancel the current download and cleanup temp files."""
-        self._cancelled = True
+        self._cancel_event.set()
         self._cleanup_temp_files()
     
     def _cleanup_temp_files(self) -> None:
         """Remove all temporary files from the download."""
-        import glob
-        
-        # Clean tracked temp files
-        for temp_file in self._temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except Exception:
-                pass
-        
-        # Clean ALL temp files in output dir (for playlists, current_title may not match)
-        temp_patterns = [
-            os.path.join(self._output_dir, "*.part"),
-            os.path.join(self._output_dir, "*.ytdl"),
-            os.path.join(self._output_dir, "*.temp"),
-            os.path.join(self._output_dir, "*.f*.mp4"),
-            os.path.join(self._output_dir, "*.f*.webm"),
-            os.path.join(self._output_dir, "*.f*.m4a"),
-        ]
-        for pattern in temp_patterns:
-            for f in glob.glob(pattern):
-                try:
-                    os.remove(f)
-                except Exception:
-                    pass
-        
+        paths = list(self._temp_files)
+
+        # Clean ALL temp files in output dir (for playlists, current_title
+        # may not match). One scandir pass replaces six glob traversals.
+        try:
+            with os.scandir(self._output_dir) as it:
+                paths.extend(
+                    entry.path for entry in it
+                    if entry.is_file() and _TEMP_FILE_RE.search(entry.name)
+                )
+        except OSError:
+            pass
+
+        if paths:
+            # A cancelled playlist can leave hundreds of fragments; on
+            # slow disks and network shares deletion is latency-bound,
+            # so overlap the unlink syscalls instead of serializing them
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(_safe_unlink, paths))
+
         self._temp_files.clear()
     
     def reset(self) -> None:
         """Reset the downloader state for a new download."""
-        self._cancelled = False
+        self._cancel_event.clear()
         self._temp_files.clear()
         self._current_title = None
+        self._last_progress_time = 0.0
+        self._last_progress_pct = -1
     
-    def get_available_formats(self, url: str) -> list[VideoFormat]:
+    def get_available_formats(self, url: str, allow_cache: bool = True) -> list[VideoFormat]:
         """
         Get available video/audio formats for a URL.
         
         Args:
             url: The YouTube video URL.
+            allow_cache: If True, serve from the in-memory/disk caches.
             
         Returns:
             List of VideoFormat objects with available resolutions.
@@ -160,13 +282,25 @@ class YouTubeDownloader:
         formats = []
         
         try:
+            yt_dlp = _ydl()
             ydl_opts = {
                 'quiet': True,
                 'no_warnings': True,
                 'noplaylist': True,
+                # Same rationale as get_video_info: a dead network should
+                # fail the fetch, not park the worker thread for minutes
+                'socket_timeout': 5,
             }
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+                info = self._get_cached_info(url) if allow_cache else None
+                if info is None and allow_cache:
+                    # Survives app restarts; fine here since only format
+                    # heights and the title are read, not stream URLs
+                    info = self._disk_cache.get(url)
+                if info is None:
+                    info = ydl.extract_info(url, download=False)
+                    self._cache_info(url, info)
+                    self._disk_cache.put(url, info)
                 
                 # Add "Best available" option first
                 formats.append(VideoFormat(
@@ -176,33 +310,35 @@ class YouTubeDownloader:
                     description='Melhor qualidade de video + audio'
                 ))
                 
-                # Collect unique resolutions
-                seen_resolutions = set()
+                # Collect unique resolutions (first filesize seen wins)
+                seen_resolutions = {}
                 available_formats = info.get('formats', [])
-                
+
                 for fmt in available_formats:
                     height = fmt.get('height')
                     if not height or height in seen_resolutions:
                         continue
-                    
+
                     # Only include common resolutions
-                    if height not in [2160, 1440, 1080, 720, 480, 360]:
+                    if height not in (2160, 1440, 1080, 720, 480, 360):
+                        continue
+
+                    seen_resolutions[height] = fmt.get('filesize')
+
+                # Emit in descending order; walking the fixed height list
+                # replaces the old post-sort and its string-parsing key
+                for height in (2160, 1440, 1080, 720, 480, 360):
+                    if height not in seen_resolutions:
                         continue
-                    
-                    seen_resolutions.add(height)
                     resolution = f"{height}p"
-                    
                     formats.append(VideoFormat(
                         format_id=f'bestvideo[height<={height}]+bestaudio/best[height<={height}]',
                         resolution=resolution,
                         ext='mp4',
-                        filesize=fmt.get('filesize'),
+                        filesize=seen_resolutions[height],
                         description=f'Video {resolution}'
                     ))
                 
-                # Sort by resolution (descending)
-                formats[1:] = sorted(formats[1:], key=lambda f: int(f.resolution.replace('p', '')), reverse=True)
-                
                 # Add audio-only option at the end
                 formats.append(VideoFormat(
                     format_id='bestaudio/best',
@@ -220,45 +356,89 @@ class YouTubeDownloader:
         
         return formats
     
-    def download(self, url: str, format_id: str = 'best', audio_only: bool = False) -> DownloadResult:
+    def download(self, url: str, format_id: str = 'best', audio_only: bool = False,
+                 known_title: Optional[str] = None,
+                 skip_if_exists: bool = True) -> DownloadResult:
         """
         Download a video from the given YouTube URL.
-        
+
         Args:
             url: The YouTube video URL.
             format_id: The format string to download (default: 'best')
             audio_only: If True, download only audio as MP3.
-            
+            known_title: Title from an earlier get_video_info call. When the
+                file for it already exists, the download (and the yt-dlp
+                round-trip) is skipped entirely.
+            skip_if_exists: If True, resolve the title (a cheap metadata
+                lookup, usually cache-served) and return the existing file
+                without downloading when it is already in output_dir.
+                Only applies to single-video downloads: in playlist mode
+                the title resolves to one entry, whose file existing says
+                nothing about the rest of the playlist.
+
         Returns:
             DownloadResult with success status, file path, and any error message.
         """
+        if skip_if_exists and self._noplaylist and not audio_only:
+            title = known_title
+            if not title:
+                info = self.get_video_info(url)
+                title = info.get('title') if info else None
+            if title:
+                existing = self.check_file_exists(title)
+                if existing:
+                    return DownloadResult(
+                        success=True,
+                        file_path=existing,
+                        title=title
+                    )
+
         # Reset state
         self.reset()
         
         try:
-            os.makedirs(self._output_dir, exist_ok=True)
+            # Only hit the filesystem the first time for this directory
+            if not self._outdir_created:
+                os.makedirs(self._output_dir, exist_ok=True)
+                self._outdir_created = True
             
             ydl_opts = self._build_options(format_id, audio_only)
             
+            yt_dlp = _ydl()
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # First get info to track title
-                info_dict = ydl.extract_info(url, download=False)
+                # First get info to track title; a recent fetch from the
+                # format picker means no extra network round-trip here
+                info_dict = self._get_cached_info(url)
+                if info_dict is None:
+                    info_dict = ydl.extract_info(url, download=False)
+                    self._cache_info(url, info_dict)
+                    self._disk_cache.put(url, info_dict)
                 self._current_title = info_dict.get('title', 'video')
                 
                 # Check if cancelled before downloading
-                if self._cancelled:
+                if self._cancel_event.is_set():
                     self._cleanup_temp_files()
                     return DownloadResult(
                         success=False,
                         error_message="Download cancelado"
                     )
                 
-                # Now download
-                info_dict = ydl.extract_info(url, download=True)
+                # Reprocess the already-fetched info instead of hitting
+                # the watch page and player a second time.
+                # process_ie_result recurses into 'entries' itself for
+                # playlist results, so no special casing is needed.
+                try:
+                    info_dict = ydl.process_ie_result(dict(info_dict), download=True)
+                except yt_dlp.utils.DownloadError:
+                    raise
+                except Exception:
+                    # Cached dict was unusable for some reason - pay for
+                    # one full re-extraction rather than failing
+                    info_dict = ydl.extract_info(url, download=True)
                 title = info_dict.get('title', 'video')
                 
                 # Check if cancelled during download
-                if self._cancelled:
+                if self._cancel_event.is_set():
                     self._cleanup_temp_files()
                     return DownloadResult(
                         success=False,
@@ -268,10 +448,14 @@ class YouTubeDownloader:
                 if 'requested_downloads' in info_dict and info_dict['requested_downloads']:
                     file_path = info_dict['requested_downloads'][0].get('filepath')
                 else:
-                    ext = info_dict.get('ext', 'mp4')
-                    file_path = os.path.join(self._output_dir, f"{title}.{ext}")
-                
-                if not file_path or not os.path.exists(file_path):
+                    # yt-dlp's own template expansion is authoritative;
+                    # the merge postprocessor rewrites the container to mp4
+                    file_path = ydl.prepare_filename(info_dict)
+                    if not audio_only:
+                        file_path = os.path.splitext(file_path)[0] + '.mp4'
+
+                if not file_path or not os.path.isfile(file_path):
+                    # Last resort: scan the output directory
                     file_path = self._find_most_recent_file()
                 
                 return DownloadResult(
@@ -281,7 +465,7 @@ class YouTubeDownloader:
                 )
                 
         except Exception as e:
-            if self._cancelled:
+            if self._cancel_event.is_set():
                 self._cleanup_temp_files()
                 return DownloadResult(
                     success=False,
@@ -309,6 +493,10 @@ class YouTubeDownloader:
             'no_warnings': False,
             'noprogress': True,
             'progress_hooks': [self._on_progress],
+            # 64 KiB write buffer and 10 MiB HTTP chunks: fewer, larger
+            # syscalls keep fast links from being write-bound
+            'buffersize': 65536,
+            'http_chunk_size': 10 * 1024 * 1024,
         }
         
         if audio_only:
@@ -355,6 +543,11 @@ class YouTubeDownloader:
     
     def _on_postprocess(self, data: dict) -> None:
         """Postprocessor hook called when video processing is complete."""
+        # Also honour cancellation between progress events, e.g. while
+        # yt-dlp is merging or converting
+        if self._cancel_event.is_set():
+            raise _ydl().utils.DownloadError("Download cancelado")
+
         if data.get('status') == 'finished' and self._video_complete_callback:
             info_dict = data.get('info_dict', {})
             title = info_dict.get('title', 'Unknown')
@@ -428,8 +621,8 @@ class YouTubeDownloader:
     def _on_progress(self, data: dict) -> None:
         """Internal progress hook that delegates to the callback."""
         # Check for cancellation and raise to interrupt yt-dlp
-        if self._cancelled:
-            raise yt_dlp.utils.DownloadError("Download cancelado")
+        if self._cancel_event.is_set():
+            raise _ydl().utils.DownloadError("Download cancelado")
         
         if self._progress_callback is None:
             return
@@ -438,7 +631,15 @@ class YouTubeDownloader:
             total_bytes = data.get('total_bytes') or data.get('total_bytes_estimate', 0)
             downloaded_bytes = data.get('downloaded_bytes', 0)
             percentage = (downloaded_bytes / total_bytes * 100) if total_bytes > 0 else 0
-            
+
+            # yt-dlp fires this hook per chunk; throttle to ~10 updates/sec
+            # unless a whole percent was gained, to keep the UI responsive
+            now = time.monotonic()
+            if (now - self._last_progress_time) <= 0.1 and int(percentage) <= self._last_progress_pct:
+                return
+            self._last_progress_time = now
+            self._last_progress_pct = int(percentage)
+
             progress = DownloadProgress(
                 status='downloading',
                 percentage=percentage,
@@ -461,16 +662,17 @@ class YouTubeDownloader:
     def _find_most_recent_file(self) -> Optional[str]:
         """Find the most recently modified mp4 file in the output directory."""
         try:
-            mp4_files = []
-            for file in os.listdir(self._output_dir):
-                if file.endswith('.mp4'):
-                    full_path = os.path.join(self._output_dir, file)
-                    mp4_files.append((full_path, os.path.getmtime(full_path)))
-            
-            if mp4_files:
-                mp4_files.sort(key=lambda x: x[1], reverse=True)
-                return mp4_files[0][0]
+            # Single pass with scandir: DirEntry caches the stat result,
+            # avoiding a re-stat per file and a full sort
+            with os.scandir(self._output_dir) as it:
+                best = max(
+                    (e for e in it if e.name.endswith('.mp4')),
+                    key=lambda e: e.stat().st_mtime,
+                    default=None
+                )
+            if best:
+                return best.path
         except Exception:
             pass
-        
+
         return None
@@ -5,12 +5,81 @@ This module provides cross-platform file operations including filename sanitizat
 and opening folders in the system file explorer.
 """
 
+import json
 import os
 import platform
 import re
+import stat
 import subprocess
 import unicodedata
 
+# orjson serializes 5-10x faster than stdlib json but is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_SYSTEM = platform.system()
+
+
+# Platform-specific open/reveal implementations, bound once at import so
+# every explorer click is a plain call instead of a platform check
+if _SYSTEM == 'Windows':
+    def _open_path(path: str) -> None:
+        os.startfile(path)
+
+    def _reveal_file(path: str) -> None:
+        # CREATE_NO_WINDOW skips the console-window allocation; explorer
+        # returns non-zero even on success, so the exit code is ignored
+        subprocess.Popen(
+            ['explorer', '/select,', os.path.normpath(path)],
+            close_fds=True,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+elif _SYSTEM == 'Darwin':
+    def _open_path(path: str) -> None:
+        subprocess.run(['open', path], check=True)
+
+    def _reveal_file(path: str) -> None:
+        subprocess.run(['open', '-R', path], check=True)
+else:  # Linux and other Unix-like
+    def _open_path(path: str) -> None:
+        subprocess.run(['xdg-open', path], check=True)
+
+    def _reveal_file(path: str) -> None:
+        # Most Linux file managers don't support selecting a file
+        # directly, so just open the containing folder
+        subprocess.run(['xdg-open', os.path.dirname(path)], check=True)
+
+
+# Compiled once at import; sanitize_filename may run per playlist entry
+_SPECIAL_RE = re.compile(r'[^\w\s]')
+_SPACES_RE = re.compile(r'\s+')
+# Combining-mark blocks left behind by NFKD decomposition
+_COMBINING_RE = re.compile(
+    '[\\u0300-\\u036f\\u1ab0-\\u1aff\\u1dc0-\\u1dff\\u20d0-\\u20ff\\ufe20-\\ufe2f]'
+)
+
+
+def write_json_atomic(path: str, data) -> None:
+    """
+    Serialize data as indented JSON and write it atomically.
+
+    Uses orjson when installed, falling back to stdlib json. The
+    payload goes to a temp sibling first and is moved into place with
+    os.replace, so a crash mid-write never corrupts the existing file.
+    """
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(buf)
+    os.replace(tmp_path, path)
+
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -22,15 +91,16 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         A sanitized filename safe for use on any filesystem.
     """
-    # Remove accents and special unicode characters
-    nfkd_form = unicodedata.normalize('NFKD', filename)
-    filename = "".join([c for c in nfkd_form if not unicodedata.combining(c)])
-    
+    # Remove accents: decompose, then strip the combining marks with a
+    # single C-level regex pass instead of a per-character Python loop
+    filename = unicodedata.normalize('NFKD', filename)
+    filename = _COMBINING_RE.sub('', filename)
+
     # Replace special characters with spaces
-    filename = re.sub(r'[^\w\s]', ' ', filename)
-    
+    filename = _SPECIAL_RE.sub(' ', filename)
+
     # Replace multiple spaces with single underscore
-    filename = re.sub(r'\s+', '_', filename)
+    filename = _SPACES_RE.sub('_', filename)
     
     # Convert to lowercase
     return filename.lower()
@@ -48,23 +118,18 @@ def open_folder(path: str) -> bool:
     Returns:
         True if the folder was opened successfully, False otherwise.
     """
-    if not os.path.exists(path):
+    # One stat answers both "does it exist" and "is it a file"
+    try:
+        st = os.stat(path)
+    except OSError:
         return False
-    
+
     # Get the directory if path is a file
-    if os.path.isfile(path):
+    if stat.S_ISREG(st.st_mode):
         path = os.path.dirname(path)
-    
+
     try:
-        system = platform.system()
-        
-        if system == 'Windows':
-            os.startfile(path)
-        elif system == 'Darwin':  # macOS
-            subprocess.run(['open', path], check=True)
-        else:  # Linux and other Unix-like
-            subprocess.run(['xdg-open', path], check=True)
-        
+        _open_path(path)
         return True
     except Exception:
         return False
@@ -84,27 +149,14 @@ def open_file_in_explorer(file_path: str) -> bool:
         return False
     
     # If file doesn't exist, try opening the folder instead
-    if not os.path.exists(file_path):
-        folder = os.path.dirname(file_path)
-        if os.path.exists(folder):
-            return open_folder(folder)
-        return False
-    
+    # (open_folder stats the folder itself, so no extra check here)
     try:
-        system = platform.system()
-        
-        if system == 'Windows':
-            # Windows explorer returns non-zero even on success, so don't use check=True
-            subprocess.run(['explorer', '/select,', os.path.normpath(file_path)])
-            return True
-        elif system == 'Darwin':  # macOS
-            subprocess.run(['open', '-R', file_path], check=True)
-        else:  # Linux
-            # Most Linux file managers don't support selecting a file directly
-            # So we just open the containing folder
-            folder = os.path.dirname(file_path)
-            subprocess.run(['xdg-open', folder], check=True)
-        
+        os.stat(file_path)
+    except OSError:
+        return open_folder(os.path.dirname(file_path))
+
+    try:
+        _reveal_file(file_path)
         return True
     except Exception:
         return False
@@ -6,15 +6,29 @@ Manages persistence of download history entries.
 
 import json
 import os
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from dataclasses import asdict
 from datetime import datetime
 from typing import List, Optional
 
 from ..models import DownloadEntry
 
+# orjson serializes 5-10x faster than stdlib json but is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+
+@lru_cache(maxsize=1)
 def _get_data_dir() -> str:
-    """Get the data directory path (inside app directory)."""
+    """Get the data directory path (inside app directory).
+
+    Cached: every mutation resolves this path, and the uncached version
+    cost three dirname calls plus a mkdir syscall each time.
+    """
     current_file = os.path.abspath(__file__)
     app_root = os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
     data_dir = os.path.join(app_root, 'data')
@@ -22,56 +36,204 @@ def _get_data_dir() -> str:
     return data_dir
 
 
+@lru_cache(maxsize=1)
 def _get_history_file() -> str:
-    """Get the download history file path."""
+    """Get the download history file path (append-only JSONL)."""
+    return os.path.join(_get_data_dir(), 'history.jsonl')
+
+
+def _get_legacy_history_file() -> str:
+    """Get the pre-JSONL history file path, used for one-time migration."""
     return os.path.join(_get_data_dir(), 'history.json')
 
 
+# orjson.loads is 3-5x faster than stdlib on the cold-start log replay
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Short-lived per-folder listing cache so burst refreshes don't re-list
+# the same directories; entries are (expiry timestamp, basenames)
+_STAT_TTL = 5.0
+_scandir_cache: dict = {}
+
+
+def _invalidate_listing(file_path: str) -> None:
+    """Drop the cached listing for a path's folder.
+
+    Mutations must call this: a listing taken before a download landed
+    would otherwise make validate_entries prune the fresh entry (and
+    compaction persist the loss) for up to the TTL.
+    """
+    _scandir_cache.pop(os.path.dirname(file_path), None)
+
+
+def _existing_basenames(folder: str) -> frozenset:
+    """Names present in folder, via one scandir (TTL-cached).
+
+    One directory listing answers the existence question for every
+    history entry in that folder, instead of one stat per file - a big
+    win on network drives. A missing folder yields an empty set.
+    """
+    now = time.monotonic()
+    hit = _scandir_cache.get(folder)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    try:
+        with os.scandir(folder) as it:
+            names = frozenset(entry.name for entry in it)
+    except OSError:
+        names = frozenset()
+    _scandir_cache[folder] = (now + _STAT_TTL, names)
+    return names
+
+
+def _dumps_line(obj) -> bytes:
+    """Serialize one history record as a JSONL line."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
 class DownloadHistory:
-    """Repository for managing download history."""
-    
+    """
+    Repository for managing download history.
+
+    Entries live in an OrderedDict keyed by file_path (most recent
+    first), which makes dedup, removal and most-recent lookup O(1)
+    instead of rebuilding a list per operation.
+
+    Persistence is an append-only JSONL file: add_entry appends one
+    line and remove_entry appends a tombstone, so a mutation costs O(1)
+    I/O instead of rewriting the whole file. The log is compacted when
+    it grows past twice the number of live entries.
+
+    A by-folder grouping is maintained incrementally alongside the
+    entries so the history panel can render folder sections without
+    re-grouping the whole list on every refresh.
+    """
+
     def __init__(self):
-        self._entries: List[DownloadEntry] = []
+        self._entries: OrderedDict[str, DownloadEntry] = OrderedDict()
+        self._by_folder: dict = {}
+        self._line_count = 0
         self._load()
-        self._remove_duplicates()
-    
+
+    @staticmethod
+    def _folder_key(file_path: str) -> str:
+        """Grouping key for an entry: its parent directory."""
+        return os.path.dirname(file_path) if file_path else "Unknown"
+
+    def _folder_add(self, entry: DownloadEntry):
+        """Add an entry to the front of its folder's group."""
+        self._by_folder.setdefault(self._folder_key(entry.file_path), []).insert(0, entry)
+
+    def _folder_discard(self, entry: DownloadEntry):
+        """Drop an entry from its folder's group (and empty groups)."""
+        folder = self._folder_key(entry.file_path)
+        group = self._by_folder.get(folder)
+        if group is None:
+            return
+        try:
+            group.remove(entry)
+        except ValueError:
+            pass
+        if not group:
+            del self._by_folder[folder]
+
+    def _rebuild_by_folder(self):
+        """Recompute the grouping from scratch (startup only)."""
+        self._by_folder = {}
+        for entry in reversed(self._entries.values()):
+            self._folder_add(entry)
+
     def _load(self):
-        """Load history from file."""
+        """Load history, replaying the JSONL log (or migrating old JSON)."""
         try:
             history_file = _get_history_file()
             if os.path.exists(history_file):
-                with open(history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self._entries = [DownloadEntry(**entry) for entry in data]
+                with open(history_file, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        self._line_count += 1
+                        try:
+                            record = _loads(line)
+                        except ValueError:
+                            continue
+                        deleted = record.get('_del')
+                        if deleted is not None:
+                            self._entries.pop(deleted, None)
+                        else:
+                            entry = DownloadEntry(**record)
+                            self._entries.pop(entry.file_path, None)
+                            self._entries[entry.file_path] = entry
+                            self._entries.move_to_end(entry.file_path, last=False)
+                self._trim()
+            else:
+                self._migrate_legacy()
         except Exception:
-            self._entries = []
-    
-    def _remove_duplicates(self):
-        """Remove duplicate entries based on file_path, keeping most recent."""
-        seen_paths = set()
-        unique_entries = []
-        for entry in self._entries:
-            if entry.file_path not in seen_paths:
-                seen_paths.add(entry.file_path)
-                unique_entries.append(entry)
-        
-        if len(unique_entries) != len(self._entries):
-            self._entries = unique_entries
-            self._save()
-    
-    def _save(self):
-        """Save history to file."""
+            self._entries = OrderedDict()
+            self._line_count = 0
+        self._rebuild_by_folder()
+
+    def _migrate_legacy(self):
+        """One-time import of the old full-rewrite history.json file."""
+        legacy_file = _get_legacy_history_file()
+        if not os.path.exists(legacy_file):
+            return
+
+        with open(legacy_file, 'rb') as f:
+            data = _loads(f.read())
+        for item in data:
+            entry = DownloadEntry(**item)
+            # First occurrence wins: the file is most-recent-first
+            self._entries.setdefault(entry.file_path, entry)
+
+        self._compact()
+        try:
+            os.remove(legacy_file)
+        except OSError:
+            pass
+
+    def _append(self, record: dict):
+        """Append one record to the log, compacting when it gets bloated."""
         try:
-            with open(_get_history_file(), 'w', encoding='utf-8') as f:
-                data = [asdict(entry) for entry in self._entries]
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(_get_history_file(), 'ab', buffering=65536) as f:
+                f.write(_dumps_line(record))
+            self._line_count += 1
+
+            if self._line_count > 2 * max(len(self._entries), 10):
+                self._compact()
+        except Exception:
+            pass
+
+    def _compact(self):
+        """Rewrite the log with only live entries, atomically."""
+        try:
+            history_file = _get_history_file()
+            tmp_path = history_file + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                # Oldest first so replay rebuilds the same order
+                for entry in reversed(self._entries.values()):
+                    f.write(_dumps_line(asdict(entry)))
+            os.replace(tmp_path, history_file)
+            self._line_count = len(self._entries)
         except Exception:
             pass
-    
+
+    def _trim(self):
+        """Drop entries beyond the 100 most recent."""
+        while len(self._entries) > 100:
+            _, entry = self._entries.popitem(last=True)
+            self._folder_discard(entry)
+
     def add_entry(self, title: str, url: str, file_path: str, file_size: Optional[int] = None):
         """Add a new download entry. Removes duplicate if same file exists."""
-        self._entries = [e for e in self._entries if e.file_path != file_path]
-        
+        _invalidate_listing(file_path)
+        old = self._entries.pop(file_path, None)
+        if old is not None:
+            self._folder_discard(old)
+
         entry = DownloadEntry(
             title=title,
             url=url,
@@ -79,37 +241,112 @@ class DownloadHistory:
             download_date=datetime.now().isoformat(),
             file_size=file_size
         )
-        self._entries.insert(0, entry)
-        self._entries = self._entries[:100]
-        self._save()
-    
+        self._entries[file_path] = entry
+        self._entries.move_to_end(file_path, last=False)
+        self._folder_add(entry)
+        self._trim()
+
+        self._append(asdict(entry))
+
+    def add_entries_bulk(self, items: List[tuple]):
+        """Add many (title, url, file_path) records with one log write.
+
+        Playlist downloads complete entries in bursts; appending them in
+        one buffered write (and trimming once) beats per-entry opens.
+        """
+        if not items:
+            return
+
+        now = datetime.now().isoformat()
+        records = []
+        for title, url, file_path in items:
+            _invalidate_listing(file_path)
+            old = self._entries.pop(file_path, None)
+            if old is not None:
+                self._folder_discard(old)
+
+            entry = DownloadEntry(
+                title=title,
+                url=url,
+                file_path=file_path,
+                download_date=now,
+                file_size=None
+            )
+            self._entries[file_path] = entry
+            self._entries.move_to_end(file_path, last=False)
+            self._folder_add(entry)
+            records.append(asdict(entry))
+        self._trim()
+
+        try:
+            with open(_get_history_file(), 'ab', buffering=65536) as f:
+                for record in records:
+                    f.write(_dumps_line(record))
+            self._line_count += len(records)
+
+            if self._line_count > 2 * max(len(self._entries), 10):
+                self._compact()
+        except Exception:
+            pass
+
+    def __len__(self) -> int:
+        """Number of history entries, without copying them into a list."""
+        return len(self._entries)
+
     def get_entries(self) -> List[DownloadEntry]:
         """Get all history entries."""
-        return self._entries.copy()
-    
+        return list(self._entries.values())
+
+    def get_by_folder(self) -> dict:
+        """Get entries grouped by parent folder, most recent first."""
+        return self._by_folder
+
     def get_last_file_path(self) -> Optional[str]:
         """Get the file path of the most recent download."""
         if self._entries:
-            return self._entries[0].file_path
+            return next(iter(self._entries))
         return None
-    
+
     def remove_entry(self, file_path: str):
         """Remove a specific entry by file path."""
-        self._entries = [e for e in self._entries if e.file_path != file_path]
-        self._save()
-    
+        _invalidate_listing(file_path)
+        entry = self._entries.pop(file_path, None)
+        if entry is not None:
+            self._folder_discard(entry)
+            self._append({'_del': file_path})
+
+    def find_stale_entries(self) -> List[str]:
+        """Paths of entries whose files no longer exist (read-only).
+
+        Safe to call from a worker thread: it iterates a snapshot of the
+        keys and mutates nothing, so the Tk thread can keep reading the
+        repository while the (slow, I/O-bound) scan runs.
+        """
+        return [
+            path for path in list(self._entries)
+            if os.path.basename(path) not in _existing_basenames(os.path.dirname(path))
+        ]
+
+    def remove_stale_entries(self, paths: List[str]) -> int:
+        """Drop the given stale entries. Must run on the owning thread."""
+        removed = 0
+        for path in paths:
+            entry = self._entries.pop(path, None)
+            if entry is not None:
+                self._folder_discard(entry)
+                removed += 1
+
+        if removed:
+            self._compact()
+
+        return removed
+
     def validate_entries(self) -> int:
         """Remove entries for files that no longer exist. Returns count of removed entries."""
-        original_count = len(self._entries)
-        self._entries = [e for e in self._entries if os.path.exists(e.file_path)]
-        removed_count = original_count - len(self._entries)
-        
-        if removed_count > 0:
-            self._save()
-        
-        return removed_count
-    
+        return self.remove_stale_entries(self.find_stale_entries())
+
     def clear(self):
         """Clear all history."""
-        self._entries = []
-        self._save()
+        self._entries.clear()
+        self._by_folder.clear()
+        self._compact()
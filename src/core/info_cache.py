@@ -0,0 +1,98 @@
+"""
+Video info disk cache.
+
+Persists yt-dlp info dicts as <video_id>.info.json files so repeat
+lookups across app sessions skip the network entirely.
+"""
+
+import json
+import os
+import re
+import time
+from typing import Optional
+
+
+def _get_cache_dir() -> str:
+    """Get the info cache directory path (inside app data directory)."""
+    current_file = os.path.abspath(__file__)
+    app_root = os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
+    cache_dir = os.path.join(app_root, 'data', 'info_cache')
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+# Matches the 11-char video id in watch, youtu.be, shorts and embed URLs
+_VIDEO_ID_RE = re.compile(r'(?:v=|youtu\.be/|/shorts/|/embed/)([A-Za-z0-9_-]{11})')
+
+
+def extract_video_id(url: str) -> Optional[str]:
+    """Extract the YouTube video id from a URL, or None if not found."""
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+class InfoCache:
+    """
+    Disk-backed cache of yt-dlp info dicts keyed by video id.
+
+    Keying by video id means youtu.be short links and full watch URLs
+    share the same entry. Entries expire after ttl seconds (default 24h)
+    so metadata like titles and available resolutions stays reasonably
+    fresh; callers must not reuse cached stream URLs for downloading,
+    as those expire server-side much sooner.
+    """
+
+    def __init__(self, ttl: int = 86400):
+        self._ttl = ttl
+        self._cache_dir = _get_cache_dir()
+
+    def _entry_path(self, video_id: str) -> str:
+        return os.path.join(self._cache_dir, f"{video_id}.info.json")
+
+    def get(self, url: str) -> Optional[dict]:
+        """Return the cached info dict for url, or None if missing/expired."""
+        video_id = extract_video_id(url)
+        if not video_id:
+            return None
+
+        path = self._entry_path(video_id)
+        try:
+            if time.time() - os.path.getmtime(path) >= self._ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url: str, info: dict) -> None:
+        """Persist an info dict for url. URLs without a video id are skipped."""
+        video_id = extract_video_id(url)
+        if not video_id:
+            return
+
+        try:
+            import yt_dlp
+            # Drop non-serializable internals the same way yt-dlp does
+            # when writing its own .info.json files
+            info = yt_dlp.YoutubeDL.sanitize_info(info)
+
+            path = self._entry_path(video_id)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(info, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            pass  # Caching is best-effort; never fail the caller
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        try:
+            with os.scandir(self._cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.info.json'):
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            pass
@@ -67,18 +67,20 @@ def check_dependencies(root: tk.Tk) -> bool:
     # Run installation
     import threading
     install_result = [False]
-    
+    install_done = tk.BooleanVar(value=False)
+
     def do_install():
         install_result[0] = ensure_ffmpeg(update_progress)
-    
+        # Flip the variable on the Tk thread to wake wait_variable
+        root.after(0, install_done.set, True)
+
     thread = threading.Thread(target=do_install)
     thread.start()
-    
-    # Wait for thread
-    while thread.is_alive():
-        root.update()
-        progress_win.update()
-    
+
+    # Block on the Tk event loop instead of busy-polling root.update(),
+    # which was spinning a full CPU core for the whole install
+    root.wait_variable(install_done)
+
     progress_win.destroy()
     
     if install_result[0]:
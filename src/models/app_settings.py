@@ -7,8 +7,16 @@ Stores user preferences with save/load functionality.
 import json
 import os
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 
+# orjson parses JSON 3-5x faster than stdlib json but is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+
+@lru_cache(maxsize=1)
 def _get_settings_dir() -> str:
     """Get the settings directory path (inside app directory)."""
     current_file = os.path.abspath(__file__)
@@ -19,6 +27,7 @@ def _get_settings_dir() -> str:
     return settings_dir
 
 
+@lru_cache(maxsize=1)
 def _get_settings_file() -> str:
     """Get the settings file path."""
     return os.path.join(_get_settings_dir(), 'settings.json')
@@ -32,9 +41,9 @@ class AppSettings:
     
     def save(self):
         """Save settings to file."""
+        from ..core.file_utils import write_json_atomic
         try:
-            with open(_get_settings_file(), 'w', encoding='utf-8') as f:
-                json.dump(asdict(self), f, indent=2, ensure_ascii=False)
+            write_json_atomic(_get_settings_file(), asdict(self))
         except Exception:
             pass
     
@@ -44,9 +53,10 @@ class AppSettings:
         try:
             settings_file = _get_settings_file()
             if os.path.exists(settings_file):
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return cls(**data)
+                with open(settings_file, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                return cls(**data)
         except Exception:
             pass
         return cls()
@@ -4,7 +4,9 @@ Download entry model.
 Represents a single download history entry.
 """
 
+import os
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 
@@ -16,3 +18,15 @@ class DownloadEntry:
     file_path: str
     download_date: str
     file_size: Optional[int] = None
+
+    @cached_property
+    def display_title(self) -> str:
+        """Title truncated for list display, computed once per entry."""
+        if len(self.title) <= 35:
+            return self.title
+        return self.title[:32] + '…'
+
+    @cached_property
+    def folder_basename(self) -> str:
+        """Basename of the entry's parent folder, computed once."""
+        return os.path.basename(os.path.dirname(self.file_path)) if self.file_path else ""
@@ -5,41 +5,79 @@ This module provides a collapsible history panel that displays
 downloaded videos organized by folder with buttons to open in explorer.
 """
 
+import threading
 import tkinter as tk
+from collections import defaultdict
 from tkinter import ttk
 from typing import Dict, List, Optional
 import os
 
-from .styles import COLORS, FONTS, SPACING
+from .styles import (COLORS, FONTS, SPACING, FONT_BODY, FONT_BODY_BOLD,
+                     FONT_SMALL, FONT_SMALL_BOLD, FONT_ROW, FONT_ICON)
 from ..core.history_repository import DownloadHistory
 from ..core.file_utils import open_file_in_explorer, open_folder
 from ..models import DownloadEntry
 
+# Placeholder child that gives collapsed folders an expand arrow until
+# their real entry rows are inserted on first open
+_LAZY_CHILD_SUFFIX = '::lazy'
+
+# Trailing child that loads the next page of a folder's entries
+_MORE_SUFFIX = '::more'
+
+# Entries shown per folder before a "Mostrar mais" click is needed
+_PAGE_SIZE = 20
+
 
 class HistoryPanel(tk.Frame):
-    """A collapsible panel displaying download history organized by folders."""
-    
+    """A collapsible panel displaying download history organized by folders.
+
+    The listing itself is a ttk.Treeview: folders are parent items and
+    downloads are children, rendered by Tk's native item store instead
+    of one Frame/Label/Button set per row, so large histories stay fast
+    to build and smooth to scroll. Children are inserted lazily on the
+    first expand of each folder.
+
+    Interactions: click a folder to expand it, double-click an entry to
+    locate the file in the system file manager, right-click an entry to
+    delete it.
+    """
+
     def __init__(self, parent, history: DownloadHistory, **kwargs):
         super().__init__(parent, bg=COLORS.BG_SECONDARY, **kwargs)
-        
+
         self._history = history
         self._is_expanded = False  # Start collapsed
         self._content_frame = None
-        
+
+        # Folders whose children have been inserted (lazy-load bookkeeping)
+        self._loaded_folders: set = set()
+        # Current grouping, kept for lazy child insertion
+        self._entries_by_folder: Dict[str, List[DownloadEntry]] = {}
+        # Entries currently visible per folder, grown by "Mostrar mais"
+        self._folder_page: Dict[str, int] = defaultdict(lambda: _PAGE_SIZE)
+
+        # Coalesces bursts of refresh requests into one rebuild per idle
+        # tick (e.g. several playlist items finishing back to back)
+        self._refresh_pending = False
+        self._refresh_after_id = None
+        self._validating = False
+        self._last_count = -1
+
         self._create_widgets()
-    
+
     def _create_widgets(self):
         """Create the panel widgets."""
         # Toggle header (always visible)
         self._header_frame = tk.Frame(self, bg=COLORS.BG_TERTIARY, cursor="hand2")
         self._header_frame.pack(fill=tk.X)
         self._header_frame.bind("<Button-1>", lambda e: self.toggle())
-        
+
         # Toggle arrow and title
         self._toggle_label = tk.Label(
             self._header_frame,
             text="▶ Histórico",
-            font=(FONTS.FAMILY, FONTS.SIZE_BODY, "bold"),
+            font=FONT_BODY_BOLD,
             bg=COLORS.BG_TERTIARY,
             fg=COLORS.TEXT_PRIMARY,
             cursor="hand2",
@@ -48,268 +86,345 @@ class HistoryPanel(tk.Frame):
         )
         self._toggle_label.pack(side=tk.LEFT)
         self._toggle_label.bind("<Button-1>", lambda e: self.toggle())
-        
+
         # Count badge
         self._count_label = tk.Label(
             self._header_frame,
             text="",
-            font=(FONTS.FAMILY, FONTS.SIZE_SMALL),
+            font=FONT_SMALL,
             bg=COLORS.ACCENT_PRIMARY,
             fg=COLORS.TEXT_PRIMARY,
             padx=6,
             pady=2
         )
         self._count_label.pack(side=tk.RIGHT, padx=10)
-        
+
         # Content container (initially hidden)
         self._content_frame = tk.Frame(self, bg=COLORS.BG_SECONDARY)
-        
+
         # Refresh button inside content
         controls_frame = tk.Frame(self._content_frame, bg=COLORS.BG_SECONDARY)
         controls_frame.pack(fill=tk.X, padx=SPACING.PADDING_SMALL, pady=SPACING.PADDING_SMALL)
-        
+
+        hint_label = tk.Label(
+            controls_frame,
+            text="2x clique: localizar | botão direito: excluir",
+            font=FONT_ICON,
+            bg=COLORS.BG_SECONDARY,
+            fg=COLORS.TEXT_MUTED
+        )
+        hint_label.pack(side=tk.LEFT)
+
         refresh_btn = tk.Button(
             controls_frame,
             text="🔄 Atualizar",
-            font=(FONTS.FAMILY, FONTS.SIZE_SMALL),
+            font=FONT_SMALL,
             bg=COLORS.BG_TERTIARY,
             fg=COLORS.TEXT_PRIMARY,
             relief=tk.FLAT,
             cursor="hand2",
-            command=self.refresh
+            command=self.request_refresh
         )
         refresh_btn.pack(side=tk.RIGHT)
-        
-        # Scrollable container
-        self._canvas = tk.Canvas(
+
+        # Dark-theme style for the tree
+        style = ttk.Style(self)
+        style.configure(
+            'History.Treeview',
+            background=COLORS.BG_SECONDARY,
+            fieldbackground=COLORS.BG_SECONDARY,
+            foreground=COLORS.TEXT_SECONDARY,
+            borderwidth=0
+        )
+
+        self._tree = ttk.Treeview(
             self._content_frame,
-            bg=COLORS.BG_SECONDARY,
-            highlightthickness=0,
-            height=400
+            show='tree',
+            selectmode='browse',
+            style='History.Treeview',
+            height=16
         )
-        
+        self._tree.tag_configure('folder', foreground=COLORS.ACCENT_PRIMARY,
+                                 font=FONT_SMALL_BOLD)
+        self._tree.tag_configure('entry', foreground=COLORS.TEXT_SECONDARY,
+                                 font=FONT_ROW)
+
         scrollbar = ttk.Scrollbar(
             self._content_frame,
             orient=tk.VERTICAL,
-            command=self._canvas.yview
+            command=self._tree.yview
         )
-        
-        self._scrollable_frame = tk.Frame(self._canvas, bg=COLORS.BG_SECONDARY)
-        
-        self._scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self._canvas.configure(scrollregion=self._canvas.bbox("all"))
-        )
-        
-        self._canvas_window = self._canvas.create_window((0, 0), window=self._scrollable_frame, anchor=tk.NW)
-        self._canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Bind canvas resize to update scrollable frame width
-        self._canvas.bind("<Configure>", self._on_canvas_configure)
-        
-        # Enable mouse wheel scrolling
-        self._canvas.bind("<MouseWheel>", self._on_mousewheel)
-        self._scrollable_frame.bind("<MouseWheel>", self._on_mousewheel)
-        
-        self._canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._tree.configure(yscrollcommand=scrollbar.set)
+
+        self._tree.bind('<<TreeviewOpen>>', self._on_folder_open)
+        self._tree.bind('<Button-1>', self._on_click)
+        self._tree.bind('<Double-1>', self._on_double_click)
+        self._tree.bind('<Button-3>', self._on_right_click)
+
+        self._tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True,
+                        padx=(SPACING.PADDING_SMALL, 0))
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
+
         # Update count
         self._update_count()
-    
-    def _on_canvas_configure(self, event):
-        """Update scrollable frame width when canvas resizes."""
-        self._canvas.itemconfig(self._canvas_window, width=event.width)
-    
-    def _on_mousewheel(self, event):
-        """Handle mouse wheel scrolling."""
-        self._canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-    
+
     def _update_count(self):
         """Update the entry count badge."""
-        count = len(self._history.get_entries())
+        count = len(self._history)
+        if count == self._last_count:
+            return
+        self._last_count = count
+
         if count > 0:
             self._count_label.config(text=str(count))
             self._count_label.pack(side=tk.RIGHT, padx=10)
         else:
             self._count_label.pack_forget()
-    
+
     def toggle(self):
         """Toggle the panel expanded/collapsed state."""
         self._is_expanded = not self._is_expanded
-        
+
         if self._is_expanded:
             self._toggle_label.config(text="▼ Histórico")
             self._content_frame.pack(fill=tk.BOTH, expand=True)
-            self.refresh()
+            self.request_refresh()
         else:
             self._toggle_label.config(text="▶ Histórico")
             self._content_frame.pack_forget()
-    
+
     def expand(self):
         """Expand the panel."""
         if not self._is_expanded:
             self.toggle()
-    
+
     def collapse(self):
         """Collapse the panel."""
         if self._is_expanded:
             self.toggle()
-    
+
+    def request_refresh(self):
+        """Schedule a refresh, coalescing repeated requests.
+
+        Any number of calls before the Tk loop goes idle result in a
+        single refresh(), so a burst of completed downloads does not
+        trigger a rebuild per video.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self._refresh_after_id = self.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        """Run the pending coalesced refresh."""
+        self._refresh_pending = False
+        self._refresh_after_id = None
+        self.refresh()
+
+    def _start_validation(self):
+        """Prune entries for deleted files on a background thread.
+
+        Stat'ing every history file can block for hundreds of ms on a
+        cold cache, so it must not run on the Tk thread. The worker only
+        *finds* the stale paths; the actual removal mutates the shared
+        entry/grouping dicts and therefore runs back on the Tk thread,
+        where refresh() may be iterating them.
+        """
+        if self._validating:
+            return
+        self._validating = True
+
+        def worker():
+            stale = []
+            try:
+                stale = self._history.find_stale_entries()
+            except Exception:
+                pass
+            self.after(0, self._finish_validation, stale)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _finish_validation(self, stale: List[str]):
+        """Apply a background validation result on the Tk thread."""
+        self._validating = False
+        if stale and self._history.remove_stale_entries(stale):
+            self.request_refresh()
+
     def refresh(self):
         """Refresh the history display."""
-        # Validate entries - remove those for files that no longer exist
-        self._history.validate_entries()
-        
-        # Clear existing widgets in scrollable frame
-        for widget in self._scrollable_frame.winfo_children():
-            widget.destroy()
-        
+        # Validate entries off-thread - stale rows disappear on the
+        # follow-up refresh instead of blocking this one
+        self._start_validation()
+
         entries = self._history.get_entries()
         self._update_count()
-        
+
+        # Grouping is maintained incrementally by the repository
+        folders = self._history.get_by_folder()
+        self._entries_by_folder = folders
+
+        current = self._tree.get_children('')
+
         if not entries:
-            empty_label = tk.Label(
-                self._scrollable_frame,
-                text="Nenhum download ainda",
-                font=(FONTS.FAMILY, FONTS.SIZE_BODY),
-                bg=COLORS.BG_SECONDARY,
-                fg=COLORS.TEXT_MUTED
-            )
-            empty_label.pack(pady=SPACING.PADDING_LARGE)
+            if current != ('::empty',):
+                if current:
+                    self._tree.delete(*current)
+                self._loaded_folders.clear()
+                self._tree.insert('', 'end', iid='::empty',
+                                  text="Nenhum download ainda", tags=('entry',))
             return
-        
-        # Group entries by folder
-        folders: Dict[str, List[DownloadEntry]] = {}
-        for entry in entries:
-            folder = os.path.dirname(entry.file_path) if entry.file_path else "Unknown"
-            if folder not in folders:
-                folders[folder] = []
-            folders[folder].append(entry)
-        
-        # Create folder sections
-        for folder_path, folder_entries in folders.items():
-            self._create_folder_section(folder_path, folder_entries)
-    
-    def _create_folder_section(self, folder_path: str, entries: List[DownloadEntry]):
-        """Create a collapsible folder section."""
-        # Folder header
-        folder_frame = tk.Frame(self._scrollable_frame, bg=COLORS.BG_TERTIARY)
-        folder_frame.pack(fill=tk.X, padx=2, pady=2)
-        
-        # Folder name (shortened)
-        folder_name = os.path.basename(folder_path) or folder_path
-        if len(folder_name) > 25:
-            folder_name = folder_name[:22] + "..."
-        
-        folder_header = tk.Frame(folder_frame, bg=COLORS.BG_TERTIARY)
-        folder_header.pack(fill=tk.X, padx=4, pady=4)
-        
-        folder_label = tk.Label(
-            folder_header,
-            text=f"📁 {folder_name} ({len(entries)})",
-            font=(FONTS.FAMILY, FONTS.SIZE_SMALL, "bold"),
-            bg=COLORS.BG_TERTIARY,
-            fg=COLORS.ACCENT_PRIMARY
-        )
-        folder_label.pack(side=tk.LEFT)
-        
-        # Open folder button
-        open_folder_btn = tk.Button(
-            folder_header,
-            text="📂",
-            font=(FONTS.FAMILY, 8),
-            bg=COLORS.BG_TERTIARY,
-            fg=COLORS.TEXT_PRIMARY,
-            relief=tk.FLAT,
-            cursor="hand2",
-            command=lambda p=folder_path: open_folder(p)
-        )
-        open_folder_btn.pack(side=tk.RIGHT)
-        
-        # Video entries
-        entries_frame = tk.Frame(folder_frame, bg=COLORS.BG_SECONDARY)
-        entries_frame.pack(fill=tk.X, padx=4, pady=(0, 4))
-        
-        for entry in entries[:10]:  # Limit to 10 per folder
-            self._create_video_entry(entries_frame, entry)
-    
-    def _create_video_entry(self, parent: tk.Frame, entry: DownloadEntry):
-        """Create a single video entry row."""
-        entry_frame = tk.Frame(parent, bg=COLORS.BG_SECONDARY)
-        entry_frame.pack(fill=tk.X, pady=1)
-        
-        # Video title (truncated) with extension badge
-        title = entry.title
-        if len(title) > 30:
-            title = title[:27] + "..."
-        
-        # Get file extension and icon
+
+        # Diff against the existing items instead of tearing everything
+        # down: destroy only vanished rows, create only new ones, and
+        # re-text the survivors in place (open state carries over free)
+        for iid in current:
+            if iid not in folders:
+                self._tree.delete(iid)
+                self._loaded_folders.discard(iid)
+
+        for index, (folder_path, folder_entries) in enumerate(folders.items()):
+            # Folder name (shortened)
+            folder_name = os.path.basename(folder_path) or folder_path
+            if len(folder_name) > 25:
+                folder_name = folder_name[:22] + "..."
+            text = f"📁 {folder_name} ({len(folder_entries)})"
+
+            if self._tree.exists(folder_path):
+                self._tree.item(folder_path, text=text)
+            else:
+                self._tree.insert('', index, iid=folder_path, text=text,
+                                  open=False, tags=('folder',))
+                # Placeholder child makes the expand arrow show; replaced
+                # by the real rows on first open
+                self._tree.insert(folder_path, 'end',
+                                  iid=folder_path + _LAZY_CHILD_SUFFIX, text="...")
+            self._tree.move(folder_path, '', index)
+
+            if folder_path in self._loaded_folders:
+                self._sync_folder_children(folder_path, folder_entries)
+
+    @staticmethod
+    def _entry_text(entry: DownloadEntry) -> str:
+        """Row text for one download: icon, truncated title, badge."""
         ext = os.path.splitext(entry.file_path)[1].lower() if entry.file_path else ""
         if ext == ".mp3":
-            icon = "🎵"
-            ext_badge = "[MP3]"
+            return f"🎵 {entry.display_title} [MP3]"
+        return f"🎬 {entry.display_title} [MP4]"
+
+    def _sync_folder_children(self, folder_path: str, entries: List[DownloadEntry]):
+        """Reconcile a folder's child rows with its current page of entries."""
+        wanted = entries[:self._folder_page[folder_path]]
+        wanted_iids = {entry.file_path for entry in wanted}
+
+        for iid in self._tree.get_children(folder_path):
+            if iid not in wanted_iids:
+                self._tree.delete(iid)
+
+        for index, entry in enumerate(wanted):
+            iid = entry.file_path
+            if self._tree.exists(iid):
+                self._tree.item(iid, text=self._entry_text(entry))
+            else:
+                self._tree.insert(folder_path, index, iid=iid,
+                                  text=self._entry_text(entry), tags=('entry',))
+            self._tree.move(iid, folder_path, index)
+
+        remaining = len(entries) - len(wanted)
+        if remaining > 0:
+            self._tree.insert(
+                folder_path, 'end', iid=folder_path + _MORE_SUFFIX,
+                text=f"▼ Mostrar mais ({remaining} restantes)", tags=('folder',)
+            )
+
+    def _show_more(self, folder_path: str):
+        """Grow a folder's visible page by one step."""
+        self._folder_page[folder_path] += _PAGE_SIZE
+        self._sync_folder_children(
+            folder_path, self._entries_by_folder.get(folder_path, []))
+
+    def _load_folder(self, folder_path: str):
+        """Insert a folder's entry rows on first expand."""
+        if folder_path in self._loaded_folders:
+            return
+        self._loaded_folders.add(folder_path)
+
+        try:
+            self._tree.delete(folder_path + _LAZY_CHILD_SUFFIX)
+        except tk.TclError:
+            pass
+
+        self._sync_folder_children(
+            folder_path, self._entries_by_folder.get(folder_path, []))
+
+    def _on_folder_open(self, event=None):
+        """Lazy-load a folder's children on first expand."""
+        iid = self._tree.focus()
+        if iid and iid in self._entries_by_folder:
+            self._load_folder(iid)
+
+    def _on_click(self, event):
+        """Handle clicks on "Mostrar mais" rows."""
+        iid = self._tree.identify_row(event.y)
+        if iid and iid.endswith(_MORE_SUFFIX):
+            self._show_more(iid[:-len(_MORE_SUFFIX)])
+
+    def _on_double_click(self, event):
+        """Locate a download (or open a folder) in the file manager."""
+        iid = self._tree.identify_row(event.y)
+        if not iid or iid == '::empty' or iid.endswith(_MORE_SUFFIX):
+            return
+        if iid in self._entries_by_folder:
+            open_folder(iid)
         else:
-            icon = "🎬"
-            ext_badge = "[MP4]"
-        
-        title_label = tk.Label(
-            entry_frame,
-            text=f"{icon} {title} {ext_badge}",
-            font=(FONTS.FAMILY, 9),
-            bg=COLORS.BG_SECONDARY,
-            fg=COLORS.TEXT_SECONDARY,
-            anchor=tk.W
-        )
-        title_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Delete button (X character for better rendering)
-        delete_btn = tk.Button(
-            entry_frame,
-            text="✕",
-            font=(FONTS.FAMILY, 8),
-            bg=COLORS.ERROR,
-            fg=COLORS.TEXT_PRIMARY,
-            relief=tk.FLAT,
-            cursor="hand2",
-            width=2,
-            command=lambda fp=entry.file_path: self._delete_entry(fp)
-        )
-        delete_btn.pack(side=tk.RIGHT, padx=(5, 0))
-        
-        # Locate in explorer button (magnifying glass) - selects the file
-        locate_btn = tk.Button(
-            entry_frame,
-            text="🔍",
-            font=(FONTS.FAMILY, 8),
-            bg=COLORS.BG_TERTIARY,
-            fg=COLORS.TEXT_PRIMARY,
-            relief=tk.FLAT,
-            cursor="hand2",
-            width=2,
-            command=lambda fp=entry.file_path: open_file_in_explorer(fp)
-        )
-        locate_btn.pack(side=tk.RIGHT, padx=(1, 8))  # More padding on the right
-    
+            open_file_in_explorer(iid)
+
+    def _on_right_click(self, event):
+        """Offer deletion for the entry under the pointer."""
+        iid = self._tree.identify_row(event.y)
+        if (iid and iid != '::empty' and not iid.endswith(_MORE_SUFFIX)
+                and iid not in self._entries_by_folder):
+            self._delete_entry(iid)
+
     def _delete_entry(self, file_path: str):
         """Delete an entry from history and the actual file from disk."""
         from tkinter import messagebox
-        
+
         # Confirm deletion
         result = messagebox.askyesno(
             "Confirmar Exclusão",
             f"Tem certeza que deseja excluir este vídeo?\n\nO arquivo será removido permanentemente do disco.",
             icon='warning'
         )
-        
+
         if result:
-            # Delete file from disk
-            try:
-                if file_path and os.path.exists(file_path):
-                    os.remove(file_path)
-            except Exception:
-                pass  # File might already be deleted or inaccessible
-            
-            # Remove from history
+            # Delete file from disk - EAFP: one unlink syscall instead
+            # of stat-then-remove, and no TOCTOU window
+            if file_path:
+                try:
+                    os.unlink(file_path)
+                except OSError:
+                    pass  # File might already be deleted or inaccessible
+
+            # Remove from history, then mutate just the affected rows
+            # in place - no need to rebuild the whole tree for one delete
             self._history.remove_entry(file_path)
-            self.refresh()
+            self._update_count()
+
+            if self._tree.exists(file_path):
+                self._tree.delete(file_path)
+
+            folder = os.path.dirname(file_path)
+            remaining = self._history.get_by_folder().get(folder)
+            if remaining is None:
+                # Folder emptied out - drop its header (and show the
+                # empty placeholder if the history is now empty)
+                if self._tree.exists(folder):
+                    self._tree.delete(folder)
+                self._loaded_folders.discard(folder)
+                if not len(self._history):
+                    self.request_refresh()
+            elif self._tree.exists(folder):
+                folder_name = os.path.basename(folder) or folder
+                if len(folder_name) > 25:
+                    folder_name = folder_name[:22] + "..."
+                self._tree.item(
+                    folder, text=f"📁 {folder_name} ({len(remaining)})")
@@ -5,11 +5,18 @@ This module provides the main application window with all UI components
 for the YouTube downloader application.
 """
 
+import queue
+import re
 import threading
+import time
 import tkinter as tk
+import tkinter.font as tkfont
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox, ttk
 from typing import Optional, List
 
+from .history_panel import HistoryPanel
 from .styles import COLORS, FONTS, SPACING
 from .widgets import StyledButton, StyledEntry, StyledProgressBar, StatusLabel
 from ..core.downloader import YouTubeDownloader
@@ -17,6 +24,29 @@ from ..core.file_utils import open_file_in_explorer, get_default_download_dir
 from ..core.history_repository import DownloadHistory
 from ..models import AppSettings, DownloadProgress, DownloadResult, VideoFormat
 
+# Compiled once: YouTube URL shapes the downloader actually supports
+# (watch, shorts, embed, youtu.be and playlist links). Rejecting bogus
+# input here avoids a pointless get_video_info round-trip. Any
+# youtube.com subdomain is accepted (www, m, music, ...) - yt-dlp
+# handles them all.
+_YT_URL_RE = re.compile(
+    r'^https?://(?:[\w-]+\.)?'
+    r'(?:youtube\.com/(?:watch\?|shorts/|embed/|playlist\?)|youtu\.be/)'
+)
+
+# URL-keyed metadata cache: paste/focus/Return cycles and the
+# pre-download existence check reuse one fetch instead of paying the
+# yt-dlp round trip each time
+_META_CACHE_TTL = 600  # seconds
+_META_CACHE_MAX = 64
+
+# Cheap pre-checks for the URL-changed path, compiled once. The loose
+# URL check only gates whether a fetch is worth attempting; _YT_URL_RE
+# stays the strict gate before an actual download.
+_URL_RE = re.compile(r'^https?://\S+')
+# 'list=' must be a query parameter, not a substring of the video id
+_PLAYLIST_RE = re.compile(r'[?&]list=')
+
 
 class MainWindow:
     """
@@ -43,37 +73,177 @@ class MainWindow:
         self._output_dir = self._settings.download_dir or get_default_download_dir()
         
         self._downloader: Optional[YouTubeDownloader] = None
+        # Long-lived downloader reserved for metadata lookups: reusing it
+        # keeps its in-memory info cache warm across fetches instead of
+        # throwing a fresh instance (and cache) away per URL
+        self._metadata_downloader = YouTubeDownloader(output_dir=self._output_dir)
         self._last_downloaded_file: Optional[str] = None
-        self._download_thread: Optional[threading.Thread] = None
+        self._check_cancelled = False
+
+        # LRU of url -> (formats, video_info, fetch time)
+        self._metadata_cache: OrderedDict = OrderedDict()
+
+        # Debounce/dedup state for URL metadata fetches. A single-worker
+        # executor replaces one-shot threads: queued fetches for URLs the
+        # user already typed past get cancelled instead of all running
+        self._url_fetch_timer: Optional[str] = None
+        self._last_fetched_url: Optional[str] = None
+        self._inflight_url: Optional[str] = None
+        self._meta_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="meta"
+        )
+        self._meta_future = None
+
+        # Latest-value slot for progress events: yt-dlp can fire >100/s,
+        # the UI repaints at most once per ~16 ms with the newest sample
+        self._progress_lock = threading.Lock()
+        self._latest_progress: Optional[tuple] = None
+        self._progress_scheduled = False
+
+        # Last rendered progress strings/value, so identical ticks skip
+        # the Tk command dispatch entirely
+        self._last_progress_text = ""
+        self._last_status_text = ""
+        self._last_pct = -1.0
+
+        # Download generation: bumped per started download so callbacks
+        # still in flight from a cancelled run can't touch the UI
+        self._download_gen = 0
+        self._current_gen = 0
+
+        # Per-video playlist completions are batched into one history
+        # write per second instead of a disk append per video
+        self._pending_history: List[tuple] = []
+        self._history_flush_timer: Optional[str] = None
+
+        # One long-lived worker consumes download tasks; enqueueing is
+        # cheaper than a thread per click and serializes double-clicks
+        self._task_queue: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
         
         # Format selection
         self._available_formats: List[VideoFormat] = []
         self._selected_format: Optional[VideoFormat] = None
+        self._format_combo_values: tuple = ()
         
         self._setup_window()
         self._create_widgets()
-    
+
+    def _get_cached_metadata(self, url: str) -> Optional[tuple]:
+        """Return fresh (formats, video_info) for url, or None."""
+        cached = self._metadata_cache.get(url)
+        if cached is None:
+            return None
+        formats, video_info, fetched_at = cached
+        if time.monotonic() - fetched_at >= _META_CACHE_TTL:
+            del self._metadata_cache[url]
+            return None
+        self._metadata_cache.move_to_end(url)
+        return formats, video_info
+
+    def _cache_metadata(self, url: str, formats: List[VideoFormat],
+                        video_info: Optional[dict]) -> None:
+        """Remember a fetched (formats, video_info) pair, LRU-evicting."""
+        self._metadata_cache[url] = (formats, video_info, time.monotonic())
+        self._metadata_cache.move_to_end(url)
+        while len(self._metadata_cache) > _META_CACHE_MAX:
+            self._metadata_cache.popitem(last=False)
+
+    def _build_history_panel(self):
+        """Construct the history panel, deferred past first paint."""
+        self._history_panel = HistoryPanel(self._history_panel_parent, self._history)
+        self._history_panel.pack(fill=tk.BOTH, expand=True)
+        # Catch up on anything marked dirty while the panel was hidden
+        # or not yet built
+        self._history_panel.bind('<Map>', lambda e: self._mark_history_dirty())
+        if self._history_dirty:
+            self._mark_history_dirty()
+
+    def _mark_history_dirty(self):
+        """Refresh the history panel, or flag it if it can't paint yet.
+
+        A refresh for a panel that isn't viewable is wasted work that
+        would be redone anyway; remember it instead and flush when the
+        panel maps.
+        """
+        panel = self._history_panel
+        if panel is None or not panel.winfo_viewable():
+            self._history_dirty = True
+            return
+        self._history_dirty = False
+        panel.request_refresh()
+
+    def _worker_loop(self):
+        """Run queued download tasks one at a time."""
+        while True:
+            task = self._task_queue.get()
+            try:
+                task()
+            except Exception:
+                pass
+            finally:
+                self._task_queue.task_done()
+
     def _setup_window(self):
         """Configure the main window properties."""
         self._root.title("YouTube Downloader")
         self._root.geometry(f"{SPACING.WINDOW_WIDTH}x{SPACING.WINDOW_HEIGHT}")
         self._root.configure(bg=COLORS.BG_PRIMARY)
         self._root.resizable(False, False)
+        self._root.protocol("WM_DELETE_WINDOW", self._on_close)
         
-        # Center the window
-        self._root.update_idletasks()
+        # Center the window. winfo_screenwidth/height query the display,
+        # not widget layout, so no idletasks flush is needed first
         x = (self._root.winfo_screenwidth() - SPACING.WINDOW_WIDTH) // 2
         y = (self._root.winfo_screenheight() - SPACING.WINDOW_HEIGHT) // 2
         self._root.geometry(f"+{x}+{y}")
-    
+
+        # Named Font objects, parsed by Tk once and shared by every
+        # widget instead of re-parsing a (family, size, weight) tuple
+        # per widget creation
+        self._font_title = tkfont.Font(
+            family=FONTS.FAMILY, size=FONTS.SIZE_TITLE, weight="bold"
+        )
+        self._font_body = tkfont.Font(family=FONTS.FAMILY, size=FONTS.SIZE_BODY)
+        self._font_body_bold = tkfont.Font(
+            family=FONTS.FAMILY, size=FONTS.SIZE_BODY, weight="bold"
+        )
+
+        # Shared widget defaults go in the option database once, so
+        # plain frames/labels/checkbuttons don't each repeat bg/fg/font
+        # kwargs (explicit kwargs still override these)
+        add = self._root.option_add
+        add('*Frame.background', COLORS.BG_PRIMARY)
+        add('*Label.background', COLORS.BG_PRIMARY)
+        add('*Label.foreground', COLORS.TEXT_PRIMARY)
+        add('*Label.font', self._font_body)
+        add('*Checkbutton.background', COLORS.BG_PRIMARY)
+        add('*Checkbutton.foreground', COLORS.TEXT_SECONDARY)
+        add('*Checkbutton.activeBackground', COLORS.BG_PRIMARY)
+        add('*Checkbutton.activeForeground', COLORS.TEXT_PRIMARY)
+        add('*Checkbutton.selectColor', COLORS.BG_TERTIARY)
+        add('*Checkbutton.font', self._font_body)
+
+    def _on_close(self):
+        """Tear down background workers and close the window.
+
+        Executor workers are non-daemon threads and get joined at
+        interpreter exit, so a metadata fetch stalled on a dead network
+        would otherwise keep the process alive after the window closes.
+        """
+        self._meta_executor.shutdown(wait=False, cancel_futures=True)
+        self._root.destroy()
+
+
     def _create_widgets(self):
         """Create and layout all UI widgets."""
         # Main container
-        main_container = tk.Frame(self._root, bg=COLORS.BG_PRIMARY)
+        main_container = tk.Frame(self._root)
         main_container.pack(fill=tk.BOTH, expand=True, padx=SPACING.PADDING_LARGE, pady=SPACING.PADDING_LARGE)
         
         # Two-column layout
-        left_panel = tk.Frame(main_container, bg=COLORS.BG_PRIMARY)
+        left_panel = tk.Frame(main_container)
         left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, SPACING.PADDING_MEDIUM))
         
         right_panel = tk.Frame(main_container, bg=COLORS.BG_SECONDARY, width=380)
@@ -87,8 +257,7 @@ class MainWindow:
         title = tk.Label(
             container,
             text="🎬 YouTube Downloader",
-            font=(FONTS.FAMILY, FONTS.SIZE_TITLE, "bold"),
-            bg=COLORS.BG_PRIMARY,
+            font=self._font_title,
             fg=COLORS.ACCENT_PRIMARY
         )
         title.pack(pady=(0, SPACING.PADDING_MEDIUM))
@@ -97,53 +266,42 @@ class MainWindow:
         subtitle = tk.Label(
             container,
             text="Download videos from YouTube in high quality",
-            font=(FONTS.FAMILY, FONTS.SIZE_BODY),
-            bg=COLORS.BG_PRIMARY,
             fg=COLORS.TEXT_SECONDARY
         )
         subtitle.pack(pady=(0, SPACING.PADDING_LARGE))
         
         # === RIGHT PANEL: History ===
-        from .history_panel import HistoryPanel
-        self._history_panel = HistoryPanel(right_panel, self._history)
-        self._history_panel.pack(fill=tk.BOTH, expand=True)
+        # Built after the first idle pass: the history panel replays the
+        # whole log and starts a validation scan, none of which should
+        # delay getting the download form on screen
+        self._history_panel = None
+        self._history_panel_parent = right_panel
+        self._history_dirty = False
+        self._root.after_idle(self._build_history_panel)
         
         # URL input section
-        url_frame = tk.Frame(container, bg=COLORS.BG_PRIMARY)
+        url_frame = tk.Frame(container)
         url_frame.pack(fill=tk.X, pady=SPACING.PADDING_MEDIUM)
         
-        url_label = tk.Label(
-            url_frame,
-            text="Video URL:",
-            font=(FONTS.FAMILY, FONTS.SIZE_BODY, "bold"),
-            bg=COLORS.BG_PRIMARY,
-            fg=COLORS.TEXT_PRIMARY
-        )
+        url_label = tk.Label(url_frame, text="Video URL:", font=self._font_body_bold)
         url_label.pack(anchor=tk.W)
         
         self._url_entry = StyledEntry(url_frame, placeholder="Paste YouTube URL here...")
         self._url_entry.pack(fill=tk.X, pady=SPACING.PADDING_SMALL)
         
-        # Bind events to fetch formats when URL changes
-        self._url_entry._entry.bind('<FocusOut>', self._on_url_changed)
-        self._url_entry._entry.bind('<Return>', self._on_url_changed)
-        self._url_entry._entry.bind('<KeyRelease>', self._on_url_key_release)
-        self._url_entry._entry.bind('<<Paste>>', lambda e: self._root.after(100, self._on_url_changed))
+        # One variable trace covers typing, paste, middle-click paste
+        # and programmatic set() - no per-event-type bindings needed,
+        # and everything still funnels through the debounced scheduler
+        self._url_entry.var.trace_add('write', lambda *_: self._schedule_url_fetch())
         
         # Directory selection section
-        dir_frame = tk.Frame(container, bg=COLORS.BG_PRIMARY)
+        dir_frame = tk.Frame(container)
         dir_frame.pack(fill=tk.X, pady=SPACING.PADDING_MEDIUM)
         
-        dir_label = tk.Label(
-            dir_frame,
-            text="Save to:",
-            font=(FONTS.FAMILY, FONTS.SIZE_BODY, "bold"),
-            bg=COLORS.BG_PRIMARY,
-            fg=COLORS.TEXT_PRIMARY
-        )
+        dir_label = tk.Label(dir_frame, text="Save to:", font=self._font_body_bold)
         dir_label.pack(anchor=tk.W)
         
-        dir_input_frame = tk.Frame(dir_frame, bg=COLORS.BG_PRIMARY)
+        dir_input_frame = tk.Frame(dir_frame)
         dir_input_frame.pack(fill=tk.X, pady=SPACING.PADDING_SMALL)
         
         self._dir_entry = StyledEntry(dir_input_frame, placeholder="", width=40)
@@ -159,29 +317,21 @@ class MainWindow:
         browse_btn.pack(side=tk.RIGHT, padx=(SPACING.PADDING_SMALL, 0))
         
         # === Settings section ===
-        settings_frame = tk.Frame(container, bg=COLORS.BG_PRIMARY)
+        settings_frame = tk.Frame(container)
         settings_frame.pack(fill=tk.X, pady=SPACING.PADDING_MEDIUM)
         
         settings_label = tk.Label(
-            settings_frame,
-            text="Configuracoes:",
-            font=(FONTS.FAMILY, FONTS.SIZE_BODY, "bold"),
-            bg=COLORS.BG_PRIMARY,
-            fg=COLORS.TEXT_PRIMARY
+            settings_frame, text="Configuracoes:", font=self._font_body_bold
         )
         settings_label.pack(anchor=tk.W)
         
         # Settings row container
-        settings_row = tk.Frame(settings_frame, bg=COLORS.BG_PRIMARY)
+        settings_row = tk.Frame(settings_frame)
         settings_row.pack(fill=tk.X, pady=SPACING.PADDING_SMALL)
         
         # Resolution dropdown
         resolution_label = tk.Label(
-            settings_row,
-            text="Qualidade:",
-            font=(FONTS.FAMILY, FONTS.SIZE_BODY),
-            bg=COLORS.BG_PRIMARY,
-            fg=COLORS.TEXT_SECONDARY
+            settings_row, text="Qualidade:", fg=COLORS.TEXT_SECONDARY
         )
         resolution_label.pack(side=tk.LEFT)
         
@@ -202,13 +352,7 @@ class MainWindow:
             settings_row,
             text="Baixar playlist completa",
             variable=self._playlist_var,
-            bg=COLORS.BG_PRIMARY,
-            fg=COLORS.TEXT_SECONDARY,
             disabledforeground=COLORS.TEXT_SECONDARY,
-            selectcolor=COLORS.BG_TERTIARY,
-            activebackground=COLORS.BG_PRIMARY,
-            activeforeground=COLORS.TEXT_PRIMARY,
-            font=(FONTS.FAMILY, FONTS.SIZE_BODY),
             state=tk.DISABLED
         )
         self._playlist_check.pack(side=tk.LEFT)
@@ -218,18 +362,12 @@ class MainWindow:
         self._audio_only_check = tk.Checkbutton(
             settings_row,
             text="Apenas audio (MP3)",
-            variable=self._audio_only_var,
-            bg=COLORS.BG_PRIMARY,
-            fg=COLORS.TEXT_SECONDARY,
-            selectcolor=COLORS.BG_TERTIARY,
-            activebackground=COLORS.BG_PRIMARY,
-            activeforeground=COLORS.TEXT_PRIMARY,
-            font=(FONTS.FAMILY, FONTS.SIZE_BODY)
+            variable=self._audio_only_var
         )
         self._audio_only_check.pack(side=tk.LEFT, padx=(SPACING.PADDING_MEDIUM, 0))
         
         # Download button
-        btn_frame = tk.Frame(container, bg=COLORS.BG_PRIMARY)
+        btn_frame = tk.Frame(container)
         btn_frame.pack(fill=tk.X, pady=SPACING.PADDING_LARGE)
         
         self._download_btn = StyledButton(
@@ -272,13 +410,17 @@ class MainWindow:
             initialdir=self._output_dir,
             title="Selecionar Pasta de Download"
         )
-        if directory:
+        # Re-picking the current directory shouldn't cost a disk write
+        if directory and directory != self._output_dir:
             self._output_dir = directory
+            self._metadata_downloader.output_dir = directory
             self._dir_entry.set(directory)
             
-            # Save preference
+            # Save preference off-thread: the atomic write can stall for
+            # tens of ms (AV scanners, slow disks) and the dialog just
+            # closed, so the UI must come back immediately
             self._settings.download_dir = directory
-            self._settings.save()
+            threading.Thread(target=self._settings.save, daemon=True).start()
     
     def _on_format_selected(self, event=None):
         """Handle format selection from combobox."""
@@ -288,49 +430,70 @@ class MainWindow:
                 self._selected_format = fmt
                 break
     
-    def _on_url_key_release(self, event=None):
-        """Handle key release in URL entry - debounced fetch."""
-        # Cancel any pending fetch
-        if hasattr(self, '_url_fetch_timer') and self._url_fetch_timer:
+    def _schedule_url_fetch(self, event=None):
+        """(Re)arm the debounced metadata fetch - one timer for all triggers."""
+        if self._url_fetch_timer is not None:
             self._root.after_cancel(self._url_fetch_timer)
-        
-        # Schedule fetch after 500ms of no typing
-        self._url_fetch_timer = self._root.after(500, self._on_url_changed)
+        self._url_fetch_timer = self._root.after(400, self._on_url_changed)
     
-    def _on_url_changed(self, event=None):
+    def _on_url_changed(self):
         """Fetch available formats when URL is entered."""
+        self._url_fetch_timer = None
         url = self._url_entry.get().strip()
         
-        if not url or not url.startswith(("http://", "https://")):
+        if not url or not _URL_RE.match(url):
             return
         
-        # Don't refetch if same URL
-        if hasattr(self, '_last_fetched_url') and self._last_fetched_url == url:
+        # Don't refetch if same URL, and don't stack a second thread on
+        # top of a fetch that's still running for it
+        if url == self._last_fetched_url or url == self._inflight_url:
             return
         
         self._last_fetched_url = url
         self._status_label.set_status("Buscando qualidades disponiveis...", "info")
         
         # Check if URL is from a playlist
-        is_playlist = 'list=' in url
+        is_playlist = _PLAYLIST_RE.search(url) is not None
         self._update_playlist_checkbox(is_playlist)
         
-        self._root.update()
-        
-        # Fetch formats in background thread
+        # Cache hit: update the combo synchronously, no thread or network
+        cached = self._get_cached_metadata(url)
+        if cached is not None:
+            self._update_format_combo(cached[0])
+            return
+
+        # No forced event-loop pump here: the status label repaints on
+        # the next idle pass and the fetch runs off-thread anyway
+        self._inflight_url = url
+
+        # Fetch formats on the metadata executor
         def fetch_formats():
             try:
-                temp_downloader = YouTubeDownloader(
-                    output_dir=self._output_dir
-                )
-                formats = temp_downloader.get_available_formats(url)
-                self._root.after(0, lambda: self._update_format_combo(formats))
+                formats = self._metadata_downloader.get_available_formats(url)
+                # One extra call while we're off-thread; it is served from
+                # the downloader's own cache and spares the pre-download
+                # check a second round trip
+                video_info = self._metadata_downloader.get_video_info(url)
+                self._cache_metadata(url, formats, video_info)
+                self._root.after(0, lambda: self._finish_url_fetch(url, formats))
             except Exception:
-                self._root.after(0, lambda: self._update_format_combo([]))
+                self._root.after(0, lambda: self._finish_url_fetch(url, []))
         
-        thread = threading.Thread(target=fetch_formats)
-        thread.daemon = True
-        thread.start()
+        # A fetch still sitting in the queue is for a URL the user has
+        # moved past; cancel() is a no-op once it has started running
+        if self._meta_future is not None:
+            self._meta_future.cancel()
+        self._meta_future = self._meta_executor.submit(fetch_formats)
+    
+    def _finish_url_fetch(self, url: str, formats: List[VideoFormat]):
+        """Apply a finished fetch on the UI thread and clear the guard."""
+        if self._inflight_url == url:
+            self._inflight_url = None
+        # A slow fetch can land after the user typed a different URL;
+        # don't let its formats overwrite the newer request's
+        if url != self._last_fetched_url:
+            return
+        self._update_format_combo(formats)
     
     def _update_playlist_checkbox(self, is_playlist: bool):
         """Enable or disable playlist checkbox based on URL type."""
@@ -346,14 +509,25 @@ class MainWindow:
         self._available_formats = formats
         
         if formats:
-            values = [f.resolution for f in formats]
-            self._format_combo['values'] = values
+            # Tuples compare cheaply against the last assignment;
+            # rewriting identical values makes Tk rebuild its listbox
+            values = tuple(f.resolution for f in formats)
+            if values != self._format_combo_values:
+                self._format_combo_values = values
+                self._format_combo['values'] = values
+            # Reset the selection unconditionally: _selected_format
+            # becomes formats[0] below, and the display must agree even
+            # when the new URL offers the same resolution list
             self._format_combo.current(0)
             self._selected_format = formats[0]
             self._status_label.set_status("Pronto para download", "success")
         else:
-            self._format_combo['values'] = ["Melhor disponivel"]
+            values = ("Melhor disponivel",)
+            if values != self._format_combo_values:
+                self._format_combo_values = values
+                self._format_combo['values'] = values
             self._format_combo.current(0)
+            self._selected_format = None
             self._status_label.set_status("", "info")
     
     def _start_download(self):
@@ -364,7 +538,7 @@ class MainWindow:
             self._status_label.set_status("Please enter a YouTube URL", "error")
             return
         
-        if not url.startswith(("http://", "https://")):
+        if not _YT_URL_RE.match(url):
             self._status_label.set_status("Please enter a valid URL", "error")
             return
         
@@ -381,26 +555,46 @@ class MainWindow:
         # Check if video already exists
         self._status_label.set_status("Verificando video...", "info")
         self._download_btn.set_enabled(False)
-        self._root.update()
-        
-        # Get video info first (in separate thread to avoid freezing)
-        def check_and_download():
-            video_info = self._downloader.get_video_info(url)
-            
-            if video_info:
-                existing_file = self._downloader.check_file_exists(video_info['title'])
-                if existing_file:
-                    # File exists - ask user on main thread
-                    self._root.after(0, lambda: self._ask_overwrite(url, video_info['title'], existing_file))
-                    return
-            
-            # No existing file or couldn't get info - proceed with download
-            self._root.after(0, lambda: self._proceed_download(url))
-        
-        thread = threading.Thread(target=check_and_download)
-        thread.daemon = True
-        thread.start()
-    
+
+        # Let the user bail out of a slow metadata fetch
+        self._check_cancelled = False
+        self._cancel_btn.set_enabled(True)
+        self._cancel_btn.pack(side=tk.LEFT, padx=(SPACING.PADDING_SMALL, 0))
+        # idletasks only: a full update() re-enters the event loop and
+        # can dispatch button clicks mid-handler
+        self._root.update_idletasks()
+
+        # Get video info first (on the worker, to avoid freezing the UI)
+        self._task_queue.put(lambda: self._check_and_download(url))
+
+    def _check_and_download(self, url: str):
+        """Check for an existing file, then hand the decision to the UI."""
+        cached = self._get_cached_metadata(url)
+        if cached is not None and cached[1] is not None:
+            video_info = cached[1]
+        else:
+            video_info = self._metadata_downloader.get_video_info(url)
+
+        if self._check_cancelled:
+            self._root.after(0, self._on_check_cancelled)
+            return
+
+        if video_info:
+            existing_file = self._downloader.check_file_exists(video_info['title'])
+            if existing_file:
+                # File exists - ask user on main thread
+                self._root.after(0, lambda: self._ask_overwrite(url, video_info['title'], existing_file))
+                return
+
+        # No existing file or couldn't get info - proceed with download
+        self._root.after(0, lambda: self._proceed_download(url))
+
+    def _on_check_cancelled(self):
+        """Restore the UI after the user cancelled the video check."""
+        self._download_btn.set_enabled(True)
+        self._cancel_btn.pack_forget()
+        self._status_label.set_status("Download cancelado", "info")
+
     def _ask_overwrite(self, url: str, title: str, existing_file: str):
         """Ask user if they want to overwrite existing file."""
         result = messagebox.askyesnocancel(
@@ -431,13 +625,17 @@ class MainWindow:
         self._cancel_btn.pack(side=tk.LEFT, padx=(SPACING.PADDING_SMALL, 0))
         self._status_label.set_status("Iniciando download...", "info")
         
-        # Start download in separate thread
-        self._download_thread = threading.Thread(target=self._download_video, args=(url,))
-        self._download_thread.daemon = True
-        self._download_thread.start()
+        # Hand the download to the worker
+        self._download_gen += 1
+        gen = self._download_gen
+        self._task_queue.put(lambda: self._download_video(url, gen))
     
-    def _download_video(self, url: str):
+    def _download_video(self, url: str, gen: int):
         """Download video in separate thread."""
+        # Downloads run serially on the worker, so this marks whose
+        # progress callbacks are currently arriving
+        self._current_gen = gen
+
         # Determine format settings
         format_id = 'best'
         audio_only = False
@@ -456,58 +654,107 @@ class MainWindow:
         result = self._downloader.download(url, format_id=format_id, audio_only=audio_only)
         
         # Update UI from main thread
-        self._root.after(0, lambda: self._on_download_complete(result))
+        self._root.after(0, lambda: self._on_download_complete(result, gen))
     
     def _on_progress(self, progress: DownloadProgress):
         """Handle progress updates from downloader."""
-        # Create a copy of progress data to avoid closure issues
-        pct = progress.percentage
-        status = progress.status
-        speed = progress.speed
-        eta = progress.eta
-        
-        # Schedule UI update on main thread
-        self._root.after(0, lambda: self._update_progress_ui(pct, status, speed, eta))
+        gen = self._current_gen
+        sample = (gen, progress.percentage, progress.status, progress.speed,
+                  progress.eta)
+
+        # Completion must never be dropped by the throttle
+        if progress.status == 'finished':
+            self._root.after(0, self._apply_progress, *sample)
+            return
+
+        # Overwrite the latest sample; schedule at most one flush per tick
+        with self._progress_lock:
+            self._latest_progress = sample
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
+        self._root.after(16, self._flush_progress)
+
+    def _flush_progress(self):
+        """Repaint the progress UI from the newest pending sample."""
+        with self._progress_lock:
+            sample = self._latest_progress
+            self._progress_scheduled = False
+        if sample is not None:
+            self._apply_progress(*sample)
+
+    def _apply_progress(self, gen: int, percentage: float, status: str,
+                        speed: str, eta: str):
+        """Apply a progress sample unless a newer download superseded it."""
+        if gen != self._download_gen:
+            return
+        self._update_progress_ui(percentage, status, speed, eta)
     
     def _on_video_complete(self, title: str, url: str, file_path: str):
         """Handle individual video completion (for playlists)."""
-        # Add to history and refresh panel on main thread
-        def add_to_history():
-            self._history.add_entry(
-                title=title,
-                url=url,
-                file_path=file_path
-            )
-            self._history_panel.refresh()
+        # Queue on the main thread; the batch flushes at most once per
+        # second while a playlist is churning out files
+        def queue_history():
+            self._pending_history.append((title, url, file_path))
+            if self._history_flush_timer is None:
+                self._history_flush_timer = self._root.after(
+                    1000, self._flush_pending_history
+                )
         
-        self._root.after(0, add_to_history)
+        self._root.after(0, queue_history)
+
+    def _flush_pending_history(self):
+        """Write queued playlist completions to history in one batch."""
+        if self._history_flush_timer is not None:
+            self._root.after_cancel(self._history_flush_timer)
+            self._history_flush_timer = None
+        if not self._pending_history:
+            return
+        pending, self._pending_history = self._pending_history, []
+        self._history.add_entries_bulk(pending)
+        self._mark_history_dirty()
     
     def _update_progress_ui(self, percentage: float, status: str, speed: str, eta: str):
         """Update progress UI elements with explicit parameters."""
         if status == 'downloading':
-            # Build info string with speed and ETA
-            info_parts = ["Baixando..."]
-            if speed:
-                info_parts.append(f"Velocidade: {speed}")
-            if eta:
-                info_parts.append(f"Tempo restante: {eta}")
-            
-            info_text = " | ".join(info_parts)
-            self._progress_bar.set_progress(percentage, info_text)
-            
-            self._status_label.set_status(
-                f"Baixando: {percentage:.1f}%",
-                "info"
-            )
+            # Single f-string per branch instead of list + join
+            if speed and eta:
+                info_text = f"Baixando... | Velocidade: {speed} | Tempo restante: {eta}"
+            elif speed:
+                info_text = f"Baixando... | Velocidade: {speed}"
+            else:
+                info_text = "Baixando..."
+
+            # Elide repaints that wouldn't change a visible pixel
+            if (info_text != self._last_progress_text
+                    or abs(percentage - self._last_pct) >= 0.1):
+                self._last_progress_text = info_text
+                self._last_pct = percentage
+                self._progress_bar.set_progress(percentage, info_text)
+
+            status_text = f"Baixando: {percentage:.1f}%"
+            if status_text != self._last_status_text:
+                self._last_status_text = status_text
+                self._status_label.set_status(status_text, "info")
         elif status == 'finished':
+            self._last_progress_text = ""
+            self._last_status_text = ""
+            self._last_pct = -1.0
             self._progress_bar.set_progress(100, "Processando vídeo...")
             self._status_label.set_status("Processando vídeo...", "info")
-        
-        # Force immediate UI refresh
-        self._root.update_idletasks()
+        # No update_idletasks here: Tk repaints on idle anyway, and a
+        # forced synchronous flush per progress event just burns CPU
     
-    def _on_download_complete(self, result: DownloadResult):
+    def _on_download_complete(self, result: DownloadResult, gen: Optional[int] = None):
         """Handle download completion."""
+        # A completion for a superseded download must not reset the UI
+        # of the one now running
+        if gen is not None and gen != self._download_gen:
+            return
+
+        # Don't leave the tail of a playlist sitting in the batch queue
+        self._flush_pending_history()
+
         self._download_btn.set_enabled(True)
         
         # Hide progress bar and cancel button after download completes
@@ -529,7 +776,7 @@ class MainWindow:
                     file_path=result.file_path
                 )
                 # Refresh history panel
-                self._history_panel.refresh()
+                self._mark_history_dirty()
             
             # Show open folder button
             self._open_folder_btn.pack(pady=SPACING.PADDING_MEDIUM)
@@ -547,7 +794,8 @@ class MainWindow:
                 )
     
     def _cancel_download(self):
-        """Cancel the current download."""
+        """Cancel the current download (or the pending video check)."""
+        self._check_cancelled = True
         if self._downloader:
             self._downloader.cancel()
             self._status_label.set_status("Cancelando download...", "info")
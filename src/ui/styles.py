@@ -3,88 +3,142 @@ UI styles module.
 
 This module defines the visual styling constants for the application,
 including colors, fonts, and spacing following modern design principles.
+
+Constants live at module scope (plain ``Final`` globals) rather than on
+frozen-dataclass singletons: widget construction does hundreds of style
+lookups, and a module global load is cheaper than instance attribute
+access. ``COLORS``/``FONTS``/``SPACING`` namespaces are kept for the
+existing call sites.
 """
 
-from dataclasses import dataclass
-
-
-@dataclass(frozen=True)
-class Colors:
-    """Color palette for the application using a modern dark theme."""
-    
-    # Background colors
-    BG_PRIMARY = "#1a1a2e"
-    BG_SECONDARY = "#16213e"
-    BG_TERTIARY = "#0f3460"
-    
-    # Accent colors
-    ACCENT_PRIMARY = "#e94560"
-    ACCENT_SECONDARY = "#ff6b6b"
-    ACCENT_GRADIENT_START = "#e94560"
-    ACCENT_GRADIENT_END = "#ff6b6b"
-    
-    # Text colors
-    TEXT_PRIMARY = "#ffffff"
-    TEXT_SECONDARY = "#b8b8b8"
-    TEXT_MUTED = "#6c6c6c"
-    
-    # Status colors
-    SUCCESS = "#4ecca3"
-    WARNING = "#ffd93d"
-    ERROR = "#ff6b6b"
-    
-    # Button colors
-    BUTTON_BG = "#e94560"
-    BUTTON_HOVER = "#ff6b6b"
-    BUTTON_ACTIVE = "#c73e54"
-    BUTTON_DISABLED = "#4a4a5a"
-    
-    # Input colors
-    INPUT_BG = "#0f3460"
-    INPUT_BORDER = "#1a1a2e"
-    INPUT_FOCUS_BORDER = "#e94560"
-    
-    # Progress bar
-    PROGRESS_BG = "#1a1a2e"
-    PROGRESS_FILL = "#4ecca3"
-
-
-@dataclass(frozen=True)
-class Fonts:
-    """Font configurations for the application."""
-    
-    FAMILY = "Segoe UI"
-    FAMILY_MONO = "Consolas"
-    
-    SIZE_TITLE = 24
-    SIZE_HEADING = 18
-    SIZE_BODY = 12
-    SIZE_SMALL = 10
-    SIZE_BUTTON = 11
-
-
-@dataclass(frozen=True)
-class Spacing:
-    """Spacing and sizing constants."""
-    
-    PADDING_SMALL = 5
-    PADDING_MEDIUM = 10
-    PADDING_LARGE = 20
-    PADDING_XLARGE = 30
-    
-    MARGIN_SMALL = 5
-    MARGIN_MEDIUM = 10
-    MARGIN_LARGE = 15
-    
-    BORDER_RADIUS = 8
-    BUTTON_HEIGHT = 40
-    INPUT_HEIGHT = 40
-    
-    WINDOW_WIDTH = 1000
-    WINDOW_HEIGHT = 650
-
-
-# Create singleton instances
-COLORS = Colors()
-FONTS = Fonts()
-SPACING = Spacing()
+from types import SimpleNamespace
+from typing import Final
+
+# --- Colors (modern dark theme) ---
+
+# Background colors
+BG_PRIMARY: Final = "#1a1a2e"
+BG_SECONDARY: Final = "#16213e"
+BG_TERTIARY: Final = "#0f3460"
+
+# Accent colors
+ACCENT_PRIMARY: Final = "#e94560"
+ACCENT_SECONDARY: Final = "#ff6b6b"
+ACCENT_GRADIENT_START: Final = "#e94560"
+ACCENT_GRADIENT_END: Final = "#ff6b6b"
+
+# Text colors
+TEXT_PRIMARY: Final = "#ffffff"
+TEXT_SECONDARY: Final = "#b8b8b8"
+TEXT_MUTED: Final = "#6c6c6c"
+
+# Status colors
+SUCCESS: Final = "#4ecca3"
+WARNING: Final = "#ffd93d"
+ERROR: Final = "#ff6b6b"
+
+# Button colors
+BUTTON_BG: Final = "#e94560"
+BUTTON_HOVER: Final = "#ff6b6b"
+BUTTON_ACTIVE: Final = "#c73e54"
+BUTTON_DISABLED: Final = "#4a4a5a"
+
+# Input colors
+INPUT_BG: Final = "#0f3460"
+INPUT_BORDER: Final = "#1a1a2e"
+INPUT_FOCUS_BORDER: Final = "#e94560"
+
+# Progress bar
+PROGRESS_BG: Final = "#1a1a2e"
+PROGRESS_FILL: Final = "#4ecca3"
+
+# --- Fonts ---
+
+FAMILY: Final = "Segoe UI"
+FAMILY_MONO: Final = "Consolas"
+
+SIZE_TITLE: Final = 24
+SIZE_HEADING: Final = 18
+SIZE_BODY: Final = 12
+SIZE_SMALL: Final = 10
+SIZE_BUTTON: Final = 11
+
+# --- Spacing and sizing ---
+
+PADDING_SMALL: Final = 5
+PADDING_MEDIUM: Final = 10
+PADDING_LARGE: Final = 20
+PADDING_XLARGE: Final = 30
+
+MARGIN_SMALL: Final = 5
+MARGIN_MEDIUM: Final = 10
+MARGIN_LARGE: Final = 15
+
+BORDER_RADIUS: Final = 8
+BUTTON_HEIGHT: Final = 40
+INPUT_HEIGHT: Final = 40
+
+WINDOW_WIDTH: Final = 1000
+WINDOW_HEIGHT: Final = 650
+
+# Backward-compatible namespaces for COLORS.X / FONTS.X / SPACING.X users
+COLORS = SimpleNamespace(
+    BG_PRIMARY=BG_PRIMARY,
+    BG_SECONDARY=BG_SECONDARY,
+    BG_TERTIARY=BG_TERTIARY,
+    ACCENT_PRIMARY=ACCENT_PRIMARY,
+    ACCENT_SECONDARY=ACCENT_SECONDARY,
+    ACCENT_GRADIENT_START=ACCENT_GRADIENT_START,
+    ACCENT_GRADIENT_END=ACCENT_GRADIENT_END,
+    TEXT_PRIMARY=TEXT_PRIMARY,
+    TEXT_SECONDARY=TEXT_SECONDARY,
+    TEXT_MUTED=TEXT_MUTED,
+    SUCCESS=SUCCESS,
+    WARNING=WARNING,
+    ERROR=ERROR,
+    BUTTON_BG=BUTTON_BG,
+    BUTTON_HOVER=BUTTON_HOVER,
+    BUTTON_ACTIVE=BUTTON_ACTIVE,
+    BUTTON_DISABLED=BUTTON_DISABLED,
+    INPUT_BG=INPUT_BG,
+    INPUT_BORDER=INPUT_BORDER,
+    INPUT_FOCUS_BORDER=INPUT_FOCUS_BORDER,
+    PROGRESS_BG=PROGRESS_BG,
+    PROGRESS_FILL=PROGRESS_FILL,
+)
+
+FONTS = SimpleNamespace(
+    FAMILY=FAMILY,
+    FAMILY_MONO=FAMILY_MONO,
+    SIZE_TITLE=SIZE_TITLE,
+    SIZE_HEADING=SIZE_HEADING,
+    SIZE_BODY=SIZE_BODY,
+    SIZE_SMALL=SIZE_SMALL,
+    SIZE_BUTTON=SIZE_BUTTON,
+)
+
+SPACING = SimpleNamespace(
+    PADDING_SMALL=PADDING_SMALL,
+    PADDING_MEDIUM=PADDING_MEDIUM,
+    PADDING_LARGE=PADDING_LARGE,
+    PADDING_XLARGE=PADDING_XLARGE,
+    MARGIN_SMALL=MARGIN_SMALL,
+    MARGIN_MEDIUM=MARGIN_MEDIUM,
+    MARGIN_LARGE=MARGIN_LARGE,
+    BORDER_RADIUS=BORDER_RADIUS,
+    BUTTON_HEIGHT=BUTTON_HEIGHT,
+    INPUT_HEIGHT=INPUT_HEIGHT,
+    WINDOW_WIDTH=WINDOW_WIDTH,
+    WINDOW_HEIGHT=WINDOW_HEIGHT,
+)
+
+# Pre-built font tuples. Building these inline allocates a fresh tuple
+# per widget and makes Tk re-parse the font spec; sharing one constant
+# lets Tk reuse the cached font object across all widgets.
+FONT_TITLE: Final = (FAMILY, SIZE_TITLE, "bold")
+FONT_BODY: Final = (FAMILY, SIZE_BODY)
+FONT_BODY_BOLD: Final = (FAMILY, SIZE_BODY, "bold")
+FONT_SMALL: Final = (FAMILY, SIZE_SMALL)
+FONT_SMALL_BOLD: Final = (FAMILY, SIZE_SMALL, "bold")
+FONT_ROW: Final = (FAMILY, 9)
+FONT_ICON: Final = (FAMILY, 8)
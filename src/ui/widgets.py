@@ -9,11 +9,31 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Optional, Callable
 
-from .styles import COLORS, FONTS, SPACING
+from .styles import COLORS, FONTS, SPACING, FONT_BODY, FONT_BODY_BOLD, FONT_SMALL
 
 
 class StyledButton(tk.Button):
-    """A styled button with hover effects and modern appearance."""
+    """A styled button with hover effects and modern appearance.
+
+    Hover handlers are registered once as class bindings on a shared
+    "StyledButton" bindtag rather than twice per instance.
+    """
+
+    _class_bindings_done = False
+
+    # Style values resolved once at class-body time; instance creation
+    # and the hover hot path read these instead of chasing COLORS/FONTS
+    # attribute lookups per call
+    _FONT = (FONTS.FAMILY, FONTS.SIZE_BUTTON, "bold")
+    _BG = COLORS.BUTTON_BG
+    _HOVER_BG = COLORS.BUTTON_HOVER
+    _ACTIVE_BG = COLORS.BUTTON_ACTIVE
+    _DISABLED_BG = COLORS.BUTTON_DISABLED
+    _FG = COLORS.TEXT_PRIMARY
+
+    # The two enable states as ready-made config kwargs
+    _ENABLED_CFG = {"state": tk.NORMAL, "bg": _BG}
+    _DISABLED_CFG = {"state": tk.DISABLED, "bg": _DISABLED_BG}
     
     def __init__(
         self,
@@ -27,11 +47,11 @@ class StyledButton(tk.Button):
             parent,
             text=text,
             command=command,
-            font=(FONTS.FAMILY, FONTS.SIZE_BUTTON, "bold"),
-            bg=COLORS.BUTTON_BG,
-            fg=COLORS.TEXT_PRIMARY,
-            activebackground=COLORS.BUTTON_ACTIVE,
-            activeforeground=COLORS.TEXT_PRIMARY,
+            font=self._FONT,
+            bg=self._BG,
+            fg=self._FG,
+            activebackground=self._ACTIVE_BG,
+            activeforeground=self._FG,
             relief=tk.FLAT,
             cursor="hand2",
             width=width,
@@ -39,29 +59,49 @@ class StyledButton(tk.Button):
             **kwargs
         )
         
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
+        # Mirrors the Tk state so hover handlers don't pay a cget
+        # round-trip just to read a value set_enabled controls anyway
+        self._enabled = True
+
+        # Route events through the shared bindtag; the two bind_class
+        # registrations happen once for the whole application
+        self.bindtags(("StyledButton",) + self.bindtags())
+        if not StyledButton._class_bindings_done:
+            StyledButton._class_bindings_done = True
+            self.bind_class("StyledButton", "<Enter>", StyledButton._on_enter)
+            self.bind_class("StyledButton", "<Leave>", StyledButton._on_leave)
     
-    def _on_enter(self, event):
+    @staticmethod
+    def _on_enter(event):
         """Handle mouse enter event."""
-        if self["state"] != tk.DISABLED:
-            self.config(bg=COLORS.BUTTON_HOVER)
+        widget = event.widget
+        if widget._enabled:
+            widget.config(bg=StyledButton._HOVER_BG)
     
-    def _on_leave(self, event):
+    @staticmethod
+    def _on_leave(event):
         """Handle mouse leave event."""
-        if self["state"] != tk.DISABLED:
-            self.config(bg=COLORS.BUTTON_BG)
+        widget = event.widget
+        if widget._enabled:
+            widget.config(bg=StyledButton._BG)
     
     def set_enabled(self, enabled: bool):
         """Enable or disable the button with appropriate styling."""
-        if enabled:
-            self.config(state=tk.NORMAL, bg=COLORS.BUTTON_BG)
-        else:
-            self.config(state=tk.DISABLED, bg=COLORS.BUTTON_DISABLED)
+        self._enabled = enabled
+        self.config(**(self._ENABLED_CFG if enabled else self._DISABLED_CFG))
 
 
-class StyledEntry(tk.Frame):
-    """A styled entry widget with placeholder support."""
+class StyledEntry(tk.Entry):
+    """A styled entry widget with placeholder support.
+
+    Subclasses tk.Entry directly: the 2px inset the old wrapper Frame
+    provided comes from highlightthickness, so each entry is one Tk
+    window instead of two.
+    """
+
+    _FONT = FONT_BODY
+    _TEXT_FG = COLORS.TEXT_PRIMARY
+    _PLACEHOLDER_FG = COLORS.TEXT_MUTED
     
     def __init__(
         self,
@@ -70,66 +110,112 @@ class StyledEntry(tk.Frame):
         width: int = 50,
         **kwargs
     ):
-        super().__init__(parent, bg=COLORS.BG_PRIMARY)
-        
         self._placeholder = placeholder
-        self._has_placeholder = True
         
-        self._entry = tk.Entry(
-            self,
-            font=(FONTS.FAMILY, FONTS.SIZE_BODY),
+        # Public StringVar: callers can trace_add("write", ...) on it
+        # instead of juggling KeyRelease/Paste event bindings
+        self.var = tk.StringVar(master=parent)
+
+        common = dict(
+            textvariable=self.var,
+            font=self._FONT,
             bg=COLORS.INPUT_BG,
-            fg=COLORS.TEXT_MUTED,
             insertbackground=COLORS.TEXT_PRIMARY,
             relief=tk.FLAT,
+            highlightthickness=2,
+            highlightbackground=COLORS.BG_PRIMARY,
+            highlightcolor=COLORS.BG_PRIMARY,
             width=width,
             **kwargs
         )
-        self._entry.pack(padx=2, pady=2, fill=tk.X, expand=True)
-        
-        # Set placeholder
-        self._entry.insert(0, placeholder)
-        
-        self._entry.bind("<FocusIn>", self._on_focus_in)
-        self._entry.bind("<FocusOut>", self._on_focus_out)
+        # Tk 9 renders placeholders natively in C; fall back to the
+        # Python focus-handler emulation on older Tk
+        try:
+            super().__init__(
+                parent,
+                fg=self._TEXT_FG,
+                placeholder=placeholder,
+                placeholderforeground=self._PLACEHOLDER_FG,
+                **common
+            )
+            self._native_placeholder = True
+            self._current_fg = self._TEXT_FG
+        except tk.TclError:
+            super().__init__(parent, fg=self._PLACEHOLDER_FG, **common)
+            self._native_placeholder = False
+            self._current_fg = self._PLACEHOLDER_FG
+
+        self._has_placeholder = not self._native_placeholder
+        if not self._native_placeholder:
+            self.insert(0, placeholder)
+            self.bind("<FocusIn>", self._on_focus_in)
+            self.bind("<FocusOut>", self._on_focus_out)
     
+    def _set_fg(self, color: str):
+        """Recolor the entry text, skipping the no-op Tcl call."""
+        if color != self._current_fg:
+            self._current_fg = color
+            self.config(fg=color)
+
     def _on_focus_in(self, event):
         """Clear placeholder on focus."""
         if self._has_placeholder:
-            self._entry.delete(0, tk.END)
-            self._entry.config(fg=COLORS.TEXT_PRIMARY)
+            self.delete(0, tk.END)
+            self._set_fg(self._TEXT_FG)
             self._has_placeholder = False
     
     def _on_focus_out(self, event):
         """Restore placeholder if empty."""
-        if not self._entry.get():
-            self._entry.insert(0, self._placeholder)
-            self._entry.config(fg=COLORS.TEXT_MUTED)
+        if not self.var.get():
+            # Recolor before inserting so the placeholder text paints
+            # once, already muted
+            self._set_fg(self._PLACEHOLDER_FG)
+            self.insert(0, self._placeholder)
             self._has_placeholder = True
     
     def get(self) -> str:
         """Get the entry value, returning empty string if placeholder is shown."""
+        # Native placeholders never count as content, so _has_placeholder
+        # stays False on that path and this returns the real text
         if self._has_placeholder:
             return ""
-        return self._entry.get()
+        return self.var.get()
     
     def set(self, value: str):
         """Set the entry value."""
         self._has_placeholder = False
-        self._entry.delete(0, tk.END)
-        self._entry.insert(0, value)
-        self._entry.config(fg=COLORS.TEXT_PRIMARY)
+        self.delete(0, tk.END)
+        self._set_fg(self._TEXT_FG)
+        self.insert(0, value)
     
     def clear(self):
         """Clear the entry and show placeholder."""
-        self._entry.delete(0, tk.END)
-        self._entry.insert(0, self._placeholder)
-        self._entry.config(fg=COLORS.TEXT_MUTED)
-        self._has_placeholder = True
+        self.delete(0, tk.END)
+        if not self._native_placeholder:
+            self._set_fg(self._PLACEHOLDER_FG)
+            self.insert(0, self._placeholder)
+            self._has_placeholder = True
 
 
 class StyledProgressBar(tk.Frame):
-    """A styled progress bar with percentage display and animated fill."""
+    """A styled progress bar with percentage display and animated fill.
+
+    The bar itself is a single Canvas with two rectangles and a text
+    item, replacing the old four-deep frame stack: one widget to lay
+    out and redraw, and fill updates are a coords() call instead of a
+    geometry-manager pass.
+    """
+
+    # All 1001 possible 0.1%-rounded label strings, built once: the hot
+    # path indexes instead of formatting a fresh string per tick
+    _PCT_STRINGS = [f"{i / 10:.1f}%" for i in range(1001)]
+
+    # Style values resolved once at class-body time for the render path
+    _FILL_COLOR = COLORS.PROGRESS_FILL
+    _TRACK_COLOR = COLORS.PROGRESS_BG
+
+    _BAR_HEIGHT = 30
+    _INSET = 2  # border width of the BG_TERTIARY rim around the track
     
     def __init__(self, parent, **kwargs):
         super().__init__(parent, bg=COLORS.BG_PRIMARY, **kwargs)
@@ -138,109 +224,183 @@ class StyledProgressBar(tk.Frame):
         self._info_label = tk.Label(
             self,
             text="Pronto para download",
-            font=(FONTS.FAMILY, FONTS.SIZE_SMALL),
+            font=FONT_SMALL,
             bg=COLORS.BG_PRIMARY,
             fg=COLORS.TEXT_SECONDARY
         )
         self._info_label.pack(pady=(0, SPACING.PADDING_SMALL))
         
-        # Outer container with border effect
-        self._outer = tk.Frame(
+        # Canvas background doubles as the border rim
+        self._canvas = tk.Canvas(
             self,
+            height=self._BAR_HEIGHT,
             bg=COLORS.BG_TERTIARY,
-            height=30,
-            relief=tk.FLAT,
-            bd=0
+            highlightthickness=0
         )
-        self._outer.pack(fill=tk.X, padx=2)
-        self._outer.pack_propagate(False)
-        
-        # Container for progress bar
-        self._container = tk.Frame(
-            self._outer,
-            bg=COLORS.PROGRESS_BG,
-            height=26
+        self._canvas.pack(fill=tk.X, padx=2)
+
+        inset = self._INSET
+        bottom = self._BAR_HEIGHT - inset
+        self._track = self._canvas.create_rectangle(
+            inset, inset, inset, bottom, fill=self._TRACK_COLOR, outline=""
         )
-        self._container.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
-        self._container.pack_propagate(False)
-        
-        # Progress fill with gradient-like color
-        self._fill = tk.Frame(
-            self._container,
-            bg=COLORS.PROGRESS_FILL,
-            height=26
+        self._fill = self._canvas.create_rectangle(
+            inset, inset, inset, bottom, fill=self._FILL_COLOR, outline=""
         )
-        self._fill.place(x=0, y=0, relheight=1.0, relwidth=0)
-        
-        # Percentage label (centered on bar)
-        self._percent_label = tk.Label(
-            self._container,
-            text="0%",
-            font=(FONTS.FAMILY, FONTS.SIZE_BODY, "bold"),
-            bg=COLORS.PROGRESS_BG,
-            fg=COLORS.TEXT_PRIMARY
+        self._text = self._canvas.create_text(
+            0, self._BAR_HEIGHT // 2,
+            text="0%", fill=COLORS.TEXT_PRIMARY, font=FONT_BODY_BOLD
         )
-        self._percent_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+
+        # Canvas width, cached from <Configure> so renders never query
+        # the widget for its size
+        self._canvas_w = 0
+        self._canvas.bind('<Configure>', self._on_canvas_configure)
+
+        # Pre-resolved Tcl invocation for the render path: calling the
+        # widget command directly skips the Misc.coords/itemconfigure
+        # wrappers and their per-call argument massaging
+        self._tk_call = self._canvas.tk.call
+        self._canvas_path = self._canvas._w
         
         self._percentage = 0.0
+
+        # Idle-coalesced rendering: set_progress only records the
+        # newest sample; one callback per idle cycle paints it. However
+        # fast callers push, the bar redraws at most once per cycle
+        self._pending_state: Optional[tuple] = None
+        self._scheduled = False
+
+        # Last rendered values: the label rounds to 0.1% and the fill
+        # can't move by less than that, so smaller deltas are invisible
+        self._last_rendered_pct = -1.0
+        self._last_info: Optional[str] = None
+        self._last_text = "0%"
+
+    def _on_canvas_configure(self, event):
+        """Track the canvas width and rescale the drawn items to it."""
+        self._canvas_w = event.width
+        inset = self._INSET
+        bottom = self._BAR_HEIGHT - inset
+        self._canvas.coords(self._track, inset, inset, event.width - inset, bottom)
+        self._canvas.coords(self._text, event.width / 2, self._BAR_HEIGHT / 2)
+        self._draw_fill()
+
+    def _draw_fill(self):
+        """Size the fill rectangle to the current percentage."""
+        inset = self._INSET
+        right = inset + (self._canvas_w - 2 * inset) * self._percentage / 100
+        self._tk_call(self._canvas_path, 'coords', self._fill,
+                      inset, inset, right, self._BAR_HEIGHT - inset)
     
     def set_progress(self, percentage: float, info: str = None):
         """
         Set the progress percentage (0-100).
         
+        Cheap by design: records the sample and arms one idle callback;
+        the actual Tk work happens in _apply_pending once per cycle.
+        
         Args:
             percentage: Progress value between 0 and 100.
             info: Optional info text to display above the bar.
         """
-        self._percentage = max(0, min(100, percentage))
-        
-        # Update fill width
-        self._fill.place(x=0, y=0, relheight=1.0, relwidth=self._percentage / 100)
+        self._pending_state = (percentage, info)
+        if not self._scheduled:
+            self._scheduled = True
+            self.after_idle(self._apply_pending)
+
+    def _apply_pending(self):
+        """Paint the newest recorded sample (one run per idle cycle)."""
+        self._scheduled = False
+        state = self._pending_state
+        self._pending_state = None
+        if state is not None:
+            self._render(*state)
+
+    def _render(self, percentage: float, info: Optional[str]):
+        """Do the actual canvas/label updates for one progress sample."""
+        new_pct = max(0, min(100, percentage))
+
+        # Sub-threshold move with no new info text: nothing would
+        # visibly change, skip the Tk calls entirely
+        if (abs(new_pct - self._last_rendered_pct) < 0.1
+                and (info is None or info == self._last_info)):
+            return
+        self._last_rendered_pct = new_pct
+        self._percentage = new_pct
         
-        # Update percentage label
-        self._percent_label.config(text=f"{self._percentage:.1f}%")
+        self._draw_fill()
         
-        # Change label background color when progress > 50%
-        if self._percentage > 50:
-            self._percent_label.config(bg=COLORS.PROGRESS_FILL)
-        else:
-            self._percent_label.config(bg=COLORS.PROGRESS_BG)
+        # Percent text via the precomputed string table; the canvas
+        # text draws over the fill, so no background flip is needed.
+        # Primitive choice: coords() for the fill rectangle (strictly
+        # cheaper than delete+create, no item churn) and itemconfigure
+        # for the text. Reports exist of delete+create_text beating
+        # itemconfigure on some Tk builds; at <=60 updates/s the text
+        # item is nowhere near hot enough to justify re-creating items
+        # and re-tracking their ids
+        new_text = self._PCT_STRINGS[int(new_pct * 10)]
+        if new_text != self._last_text:
+            self._last_text = new_text
+            self._tk_call(self._canvas_path, 'itemconfigure', self._text,
+                          '-text', new_text)
         
-        # Update info label if provided
-        if info:
+        # Update info label if provided and actually different
+        if info and info != self._last_info:
+            self._last_info = info
             self._info_label.config(text=info)
-        
-        # Force UI update
-        self.update_idletasks()
+        # No forced flush: Tk repaints on the next idle pass; callers
+        # that truly need a synchronous paint can call flush()
     
     def set_info(self, info: str):
         """Set the info text above the progress bar."""
         self._info_label.config(text=info)
+
+    def flush(self):
+        """Force a synchronous repaint (for modal flows only)."""
         self.update_idletasks()
     
     def reset(self):
         """Reset the progress bar to 0%."""
+        # Drop any sample still waiting for the idle callback; a
+        # scheduled _apply_pending with no state is a no-op
+        self._pending_state = None
         self._percentage = 0.0
-        self._fill.place(x=0, y=0, relheight=1.0, relwidth=0)
-        self._percent_label.config(text="0%", bg=COLORS.PROGRESS_BG)
+        self._last_rendered_pct = -1.0
+        self._last_info = None
+        self._last_text = "0%"
+        self._draw_fill()
+        self._canvas.itemconfigure(self._text, text="0%")
         self._info_label.config(text="Pronto para download")
-        self.update_idletasks()
 
 
 class StatusLabel(tk.Label):
     """A label for displaying status messages with appropriate coloring."""
+
+    # Status-type palette, built once at class-body time instead of a
+    # fresh dict per set_status call
+    _COLOR_MAP = {
+        "info": COLORS.TEXT_SECONDARY,
+        "success": COLORS.SUCCESS,
+        "warning": COLORS.WARNING,
+        "error": COLORS.ERROR
+    }
     
     def __init__(self, parent, **kwargs):
         super().__init__(
             parent,
             text="",
-            font=(FONTS.FAMILY, FONTS.SIZE_BODY),
+            font=FONT_BODY,
             bg=COLORS.BG_PRIMARY,
             fg=COLORS.TEXT_SECONDARY,
             wraplength=500,
             justify=tk.CENTER,
             **kwargs
         )
+        # Last applied message/color, tracked so repeated identical
+        # updates skip the Tcl round-trip entirely
+        self._current_fg = COLORS.TEXT_SECONDARY
+        self._last_message: Optional[str] = None
     
     def set_status(self, message: str, status_type: str = "info"):
         """
@@ -250,14 +410,18 @@ class StatusLabel(tk.Label):
             message: The status message to display.
             status_type: One of 'info', 'success', 'warning', 'error'.
         """
-        color_map = {
-            "info": COLORS.TEXT_SECONDARY,
-            "success": COLORS.SUCCESS,
-            "warning": COLORS.WARNING,
-            "error": COLORS.ERROR
-        }
-        self.config(text=message, fg=color_map.get(status_type, COLORS.TEXT_SECONDARY))
+        fg = self._COLOR_MAP.get(status_type, COLORS.TEXT_SECONDARY)
+        # Same message in the same color: nothing to do
+        if message == self._last_message and fg == self._current_fg:
+            return
+        self._last_message = message
+        if fg != self._current_fg:
+            self._current_fg = fg
+            self.config(text=message, fg=fg)
+        else:
+            self.config(text=message)
     
     def clear(self):
         """Clear the status message."""
+        self._last_message = None
         self.config(text="")